@@ -1,16 +1,15 @@
 """Generate langauge specific loaders for a particular SALAD schema."""
+import hashlib
+import json
+import os
+import pathlib
 import sys
-from io import TextIOWrapper
-from typing import (
-    Any,
-    Dict,
-    List,
-    MutableMapping,
-    MutableSequence,
-    Optional,
-    TextIO,
-    Union,
-)
+import tempfile
+from io import StringIO
+from typing import IO, Any, Dict, List, MutableMapping, MutableSequence, Optional
+
+import pkg_resources
+from pkg_resources import resource_string
 
 from . import schema
 from .codegen_base import CodeGenBase
@@ -21,6 +20,109 @@ from .ref_resolver import Loader
 from .schema import shortname
 from .utils import aslist
 
+_generator_sources = (
+    "codegen.py",
+    "codegen_base.py",
+    "python_codegen.py",
+    "python_codegen_support.py",
+    "schema.py",
+    "utils.py",
+)
+
+_cache_entries = 32
+
+
+def _schema_salad_version() -> str:
+    try:
+        return pkg_resources.get_distribution("schema-salad").version
+    except pkg_resources.DistributionNotFound:
+        return "unknown"
+
+
+def _python_cache_path(
+    i: List[Dict[str, str]], loader: Loader, copyright: Optional[str]
+) -> pathlib.Path:
+    """Locate the cached Python code for this schema and generator version."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(_schema_salad_version().encode("utf-8"))
+    for source in _generator_sources:
+        digest.update(resource_string(__name__, source))
+    digest.update(
+        json.dumps([i, loader.vocab, copyright], sort_keys=True, default=str).encode(
+            "utf-8"
+        )
+    )
+    root = pathlib.Path(os.environ.get("HOME", tempfile.gettempdir()))
+    return root / ".cache" / "salad" / "codegen" / f"{digest.hexdigest()}.py"
+
+
+def _load_python_cache(cache_path: pathlib.Path) -> Optional[str]:
+    """
+    Read the cached code, if any, and mark it as recently used.
+
+    The cache is best effort: None is returned when the entry can not be
+    read, so that the code gets generated again.
+    """
+    try:
+        code = cache_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return code
+
+
+def _store_python_cache(cache_path: pathlib.Path, code: str) -> None:
+    """
+    Atomically save the generated code, keeping the most recently used entries.
+
+    The cache is best effort, so failures are ignored.
+    """
+    tmp = None  # type: Optional[str]
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(code)
+        os.replace(tmp, cache_path)
+        tmp = None
+        entries = sorted(
+            cache_path.parent.glob("*.py"),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True,
+        )
+        for entry in entries[_cache_entries:]:
+            entry.unlink()
+    except OSError:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def _open_python_target(target: Optional[str]) -> IO[str]:
+    """
+    Open the target file with a large buffer, or fall back to stdout.
+
+    The generator issues many small writes, which the buffer turns into a
+    handful of write syscalls.
+    """
+    if target:
+        return open(target, mode="w", encoding="utf-8", buffering=1 << 20)
+    return sys.stdout
+
+
+def _write_python(code: str, target: Optional[str]) -> None:
+    """Write the generated code to the target file, or to stdout."""
+    if target:
+        with open(target, mode="w", encoding="utf-8") as f:
+            f.write(code)
+    else:
+        sys.stdout.write(code)
+
 
 def codegen(
     lang: str,
@@ -31,20 +133,31 @@ def codegen(
     examples: Optional[str] = None,
     package: Optional[str] = None,
     copyright: Optional[str] = None,
+    use_cache: bool = False,
 ) -> None:
-    """Generate classes with loaders for the given Schema Salad description."""
+    """
+    Generate classes with loaders for the given Schema Salad description.
 
-    j = schema.extend_and_specialize(i, loader)
+    With use_cache, generated Python code is reused from and saved to
+    ~/.cache/salad/codegen.
+    """
 
     gen = None  # type: Optional[CodeGenBase]
+    out = None  # type: Optional[StringIO]
+    dest = None  # type: Optional[IO[str]]
+    cache_path = None  # type: Optional[pathlib.Path]
     if lang == "python":
-        if target:
-            dest: Union[TextIOWrapper, TextIO] = open(
-                target, mode="w", encoding="utf-8"
-            )
+        if use_cache:
+            cache_path = _python_cache_path(i, loader, copyright)
+            cached = _load_python_cache(cache_path)
+            if cached is not None:
+                _write_python(cached, target)
+                return
+            out = StringIO()
+            gen = PythonCodeGen(out, copyright=copyright)
         else:
-            dest = sys.stdout
-        gen = PythonCodeGen(dest, copyright=copyright)
+            dest = _open_python_target(target)
+            gen = PythonCodeGen(dest, copyright=copyright)
     elif lang == "java":
         gen = JavaCodeGen(
             schema_metadata.get("$base", schema_metadata.get("id")),
@@ -56,6 +169,9 @@ def codegen(
     else:
         raise SchemaSaladException(f"Unsupported code generation language '{lang}'")
 
+    j = schema.extend_and_specialize(i, loader)
+
+    gen.plan_classes(j)
     gen.prologue()
 
     document_roots = []
@@ -162,3 +278,11 @@ def codegen(
     root_type.append({"type": "array", "items": document_roots})
 
     gen.epilogue(gen.type_loader(root_type))
+
+    if out is not None:
+        code = out.getvalue()
+        _write_python(code, target)
+        if cache_path is not None:
+            _store_python_cache(cache_path, code)
+    elif dest is not None and dest is not sys.stdout:
+        dest.close()
@@ -59,6 +59,9 @@ class CodeGenBase:
         """Add the given name as an abbreviation for the given URI."""
         self.vocab[name] = uri
 
+    def plan_classes(self, records: List[Dict[str, Any]]) -> None:
+        """Inspect all the schema definitions before any code is generated."""
+
     def prologue(self) -> None:
         """Trigger to generate the prolouge code."""
         raise NotImplementedError()
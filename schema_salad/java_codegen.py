@@ -2,7 +2,6 @@
 import os
 import shutil
 import string
-from io import StringIO
 from io import open as io_open
 from typing import (
     Any,
@@ -178,9 +177,9 @@ class JavaCodeGen(CodeGenBase):
         cls = self.interface_name(classname)
         self.current_class = cls
         self.current_class_is_abstract = abstract
-        self.current_loader = StringIO()
+        self.current_loader = []  # type: List[str]
         self.current_fieldtypes = {}  # type: Dict[str, TypeDef]
-        self.current_fields = StringIO()
+        self.current_fields = []  # type: List[str]
         interface_doc_str = f"* Auto-generated interface for <I>{classname}</I><BR>"
         if not abstract:
             implemented_by = "This interface is implemented by {{@link {}Impl}}<BR>"
@@ -290,7 +289,7 @@ public class {cls}Impl extends SavableImpl implements {cls} {{
                     class_doc_str=class_doc_str,
                 )
             )
-        self.current_loader.write(
+        self.current_loader.append(
             """
   /**
    * Used by {{@link {package}.utils.RootLoader}} to construct instances of {cls}Impl.
@@ -340,7 +339,7 @@ public class {cls}Impl extends SavableImpl implements {cls} {{
         if self.current_class_is_abstract:
             return
 
-        self.current_loader.write(
+        self.current_loader.append(
             """    if (!__errors.isEmpty()) {
       throw new ValidationException("Trying 'RecordField'", __errors);
     }
@@ -350,21 +349,21 @@ public class {cls}Impl extends SavableImpl implements {cls} {{
             fieldtype = self.current_fieldtypes.get(fieldname)
             if fieldtype is None:
                 continue
-            self.current_loader.write(
+            self.current_loader.append(
                 """    this.{safename} = ({type}) {safename};
 """.format(
                     safename=self.safe_name(fieldname), type=fieldtype.instance_type
                 )
             )
 
-        self.current_loader.write("""  }""")
+        self.current_loader.append("""  }""")
 
         with open(
             os.path.join(self.main_src_dir, f"{self.current_class}Impl.java"),
             "a",
         ) as f:
-            f.write(self.current_fields.getvalue())
-            f.write(self.current_loader.getvalue())
+            f.write("".join(self.current_fields))
+            f.write("".join(self.current_loader))
             f.write(
                 """
 }
@@ -607,7 +606,7 @@ public enum {clazz} {{
         if self.current_class_is_abstract:
             return
 
-        self.current_fields.write(
+        self.current_fields.append(
             """
   private {type} {safename};
 
@@ -623,14 +622,14 @@ public enum {clazz} {{
             )
         )
 
-        self.current_loader.write(
+        self.current_loader.append(
             """    {type} {safename};
 """.format(
                 type=fieldtype.instance_type, safename=safename
             )
         )
         if optional:
-            self.current_loader.write(
+            self.current_loader.append(
                 """
     if (__doc.containsKey("{fieldname}")) {{
 """.format(
@@ -641,7 +640,7 @@ public enum {clazz} {{
         else:
             spc = ""
 
-        self.current_loader.write(
+        self.current_loader.append(
             """{spc}    try {{
 {spc}      {safename} =
 {spc}          LoaderInstances
@@ -661,7 +660,7 @@ public enum {clazz} {{
         )
 
         if optional:
-            self.current_loader.write(
+            self.current_loader.append(
                 """
     }} else {{
       {safename} = null;
@@ -708,7 +707,7 @@ public enum {clazz} {{
         if subscope is not None:
             name = name + subscope
 
-        self.current_loader.write(
+        self.current_loader.append(
             set_uri.format(safename=self.safe_name(name), fieldname=shortname(name))
         )
 
@@ -121,6 +121,13 @@ def main(argsl: Optional[List[str]] = None) -> int:
         "from the base URL (Java only).",
     ),
 
+    parser.add_argument(
+        "--codegen-cache",
+        action="store_true",
+        help="Reuse the generated code cached in ~/.cache/salad/codegen, and "
+        "cache newly generated code there (Python only).",
+    )
+
     parser.add_argument(
         "--codegen-copyright",
         type=str,
@@ -294,6 +301,7 @@ def main(argsl: Optional[List[str]] = None) -> int:
             examples=args.codegen_examples,
             package=args.codegen_package,
             copyright=args.codegen_copyright,
+            use_cache=args.codegen_cache,
         )
         return 0
 
@@ -1,11 +1,11 @@
 import argparse
-import copy
+import functools
 import logging
 import os
 import re
 import sys
 from codecs import StreamWriter
-from io import StringIO, TextIOWrapper
+from io import TextIOWrapper
 from typing import (
     IO,
     Any,
@@ -15,9 +15,9 @@ from typing import (
     MutableSequence,
     Optional,
     Set,
+    TextIO,
     Tuple,
     Union,
-    cast,
 )
 from urllib.parse import urldefrag
 
@@ -30,23 +30,33 @@ from .utils import add_dictlist, aslist
 
 _logger = logging.getLogger("salad")
 
+_re_heading = re.compile(r"^(#+) (.*)")
+_re_url = re.compile(r"^(https?://\S+)")
+_re_email = re.compile(r"<([^>@]+@[^>]+)>")
+
+_salad_null = sys.intern(schema.saladp + "null")
+_salad_record = sys.intern(schema.saladp + "record")
+_salad_enum = sys.intern(schema.saladp + "enum")
+_salad_array = sys.intern(schema.saladp + "array")
+
 
 def has_types(items: Any) -> List[str]:
     r = []  # type: List[str]
-    if isinstance(items, MutableMapping):
-        if items["type"] == "https://w3id.org/cwl/salad#record":
-            return [items["name"]]
-        for n in ("type", "items", "values"):
-            if n in items:
-                r.extend(has_types(items[n]))
-        return r
-    if isinstance(items, MutableSequence):
-        for i in items:
-            r.extend(has_types(i))
-        return r
-    if isinstance(items, str):
-        return [items]
-    return []
+    stack = [items]  # type: List[Any]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            if item["type"] == _salad_record:
+                r.append(item["name"])
+                continue
+            for n in ("values", "items", "type"):
+                if n in item:
+                    stack.append(item[n])
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+        elif isinstance(item, str):
+            r.append(item)
+    return r
 
 
 def linkto(item: str) -> str:
@@ -73,34 +83,38 @@ class MyRenderer(mistune.Renderer):
         ).format(header, body)
 
 
+_digits = frozenset("0123456789")
+
+
+@functools.lru_cache(maxsize=4096)
 def to_id(text: str) -> str:
-    textid = text
-    if text[0] in ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9"):
-        try:
-            textid = text[text.index(" ") + 1 :]
-        except ValueError:
-            pass
-    return textid.replace(" ", "_")
+    if text[:1] in _digits:
+        _, sep, tail = text.partition(" ")
+        if sep:
+            text = tail
+    if " " in text:
+        return text.replace(" ", "_")
+    return text
 
 
 class ToC:
     def __init__(self) -> None:
         self.first_toc_entry = True
         self.numbering = [0]
-        self.toc = ""
+        self.toc = []  # type: List[str]
         self.start_numbering = True
 
     def add_entry(self, thisdepth, title):  # type: (int, str) -> str
         depth = len(self.numbering)
         if thisdepth < depth:
-            self.toc += "</ol>"
+            self.toc.append("</ol>")
             for _ in range(0, depth - thisdepth):
                 self.numbering.pop()
-                self.toc += "</li></ol>"
+                self.toc.append("</li></ol>")
             self.numbering[-1] += 1
         elif thisdepth == depth:
             if not self.first_toc_entry:
-                self.toc += "</ol>"
+                self.toc.append("</ol>")
             else:
                 self.first_toc_entry = False
             self.numbering[-1] += 1
@@ -114,37 +128,51 @@ class ToC:
             if self.start_numbering
             else ""
         )
-        self.toc += """<li><a href="#{}">{} {}</a><ol>\n""".format(
-            to_id(title), num, title
+        self.toc.append(
+            """<li><a href="#{}">{} {}</a><ol>\n""".format(to_id(title), num, title)
         )
         return num
 
     def contents(self, idn: str) -> str:
-        toc = """<h1 id="{}">Table of contents</h1>
-               <nav class="tocnav"><ol>{}""".format(
-            idn, self.toc
+        return "".join(
+            [
+                """<h1 id="{}">Table of contents</h1>
+               <nav class="tocnav"><ol>""".format(
+                    idn
+                ),
+                "".join(self.toc),
+                "</ol>",
+                "</li></ol>" * len(self.numbering),
+                "</nav>",
+            ]
         )
-        toc += "</ol>"
-        for _ in range(0, len(self.numbering)):
-            toc += "</li></ol>"
-        toc += """</nav>"""
-        return toc
-
-
-basicTypes = (
-    "https://w3id.org/cwl/salad#null",
-    "http://www.w3.org/2001/XMLSchema#boolean",
-    "http://www.w3.org/2001/XMLSchema#int",
-    "http://www.w3.org/2001/XMLSchema#long",
-    "http://www.w3.org/2001/XMLSchema#float",
-    "http://www.w3.org/2001/XMLSchema#double",
-    "http://www.w3.org/2001/XMLSchema#string",
-    "https://w3id.org/cwl/salad#record",
-    "https://w3id.org/cwl/salad#enum",
-    "https://w3id.org/cwl/salad#array",
+
+
+basicTypes = frozenset(
+    (
+        _salad_null,
+        "http://www.w3.org/2001/XMLSchema#boolean",
+        "http://www.w3.org/2001/XMLSchema#int",
+        "http://www.w3.org/2001/XMLSchema#long",
+        "http://www.w3.org/2001/XMLSchema#float",
+        "http://www.w3.org/2001/XMLSchema#double",
+        "http://www.w3.org/2001/XMLSchema#string",
+        _salad_record,
+        _salad_enum,
+        _salad_array,
+    )
 )
 
 
+_field_row = """
+<div class="row responsive-table-row">
+<div class="col-xs-3 col-lg-2"><code>{}</code></div>
+<div class="col-xs-2 col-lg-1">{}</div>
+<div class="col-xs-7 col-lg-3">{}</div>
+<div class="col-xs-12 col-lg-6 description-col">{}</div>
+</div>"""
+
+
 def number_headings(toc: ToC, maindoc: str) -> str:
     mdlines = []
     skip = False
@@ -158,15 +186,17 @@ def number_headings(toc: ToC, maindoc: str) -> str:
             skip = not skip
 
         if not skip:
-            m = re.match(r"^(#+) (.*)", line)
-            if m is not None:
-                group1 = m.group(1)
-                assert group1 is not None  # nosec
-                group2 = m.group(2)
-                assert group2 is not None  # nosec
-                num = toc.add_entry(len(group1), group2)
-                line = f"{group1} {num} {group2}"
-            line = re.sub(r"^(https?://\S+)", r"[\1](\1)", line)
+            if line.startswith("#"):
+                m = _re_heading.match(line)
+                if m is not None:
+                    group1 = m.group(1)
+                    assert group1 is not None  # nosec
+                    group2 = m.group(2)
+                    assert group2 is not None  # nosec
+                    num = toc.add_entry(len(group1), group2)
+                    line = f"{group1} {num} {group2}"
+            elif line.startswith(("http://", "https://")):
+                line = _re_url.sub(r"[\1](\1)", line)
         mdlines.append(line)
 
     maindoc = "\n".join(mdlines)
@@ -174,12 +204,9 @@ def number_headings(toc: ToC, maindoc: str) -> str:
 
 
 def fix_doc(doc: Union[List[str], str]) -> str:
-    docstr = "".join(doc) if isinstance(doc, MutableSequence) else doc
+    docstr = "".join(doc) if isinstance(doc, list) else doc
     return "\n".join(
-        [
-            re.sub(r"<([^>@]+@[^>]+)>", r"[\1](mailto:\1)", d)
-            for d in docstr.splitlines()
-        ]
+        [_re_email.sub(r"[\1](mailto:\1)", d) for d in docstr.splitlines()]
     )
 
 
@@ -192,7 +219,7 @@ class RenderType:
         redirects: Dict[str, str],
         primitiveType: str,
     ) -> None:
-        self.typedoc = StringIO()
+        self.typedoc = []  # type: List[str]
         self.toc = toc
         self.subs = {}  # type: Dict[str, str]
         self.docParent = {}  # type: Dict[str, List[str]]
@@ -201,6 +228,13 @@ class RenderType:
         self.redirects = redirects
         self.title = None  # type: Optional[str]
         self.primitiveType = primitiveType
+        self.fragments = {}  # type: Dict[str, str]
+        self.field_docs = {}  # type: Dict[str, str]
+        # mistune.markdown() builds a new parser for every call; these are
+        # reused instead, mistune resets their state after each document.
+        self.markdown = mistune.Markdown(renderer=MyRenderer(), escape=True)
+        self.field_markdown = mistune.Markdown(escape=True)
+        self.typefmts = {}  # type: Dict[Tuple[int, ...], Tuple[Any, Any, str]]
 
         for t in j:
             if "extends" in t:
@@ -222,46 +256,63 @@ class RenderType:
         metaschema_loader = schema.get_metaschema()[2]
         alltypes = schema.extend_and_specialize(j, metaschema_loader)
 
-        self.typemap = {}  # type: Dict[str, Dict[str, str]]
-        self.uses = {}  # type: Dict[str, List[Tuple[str, str]]]
+        self.typemap = {
+            entry["name"]: entry for entry in alltypes
+        }  # type: Dict[str, Dict[str, str]]
+        self.uses = {}  # type: Dict[str, Dict[Tuple[str, str], None]]
         self.record_refs = {}  # type: Dict[str, List[str]]
+        renderset = frozenset(renderlist)
+        torender = []  # type: List[Dict[str, str]]
         for entry in alltypes:
-            self.typemap[entry["name"]] = entry
             try:
                 if entry["type"] == "record":
-                    self.record_refs[entry["name"]] = []
+                    refs = []  # type: List[str]
+                    self.record_refs[entry["name"]] = refs
                     fields = entry.get(
                         "fields", []
                     )  # type: Union[str, List[Dict[str, str]]]
                     if isinstance(fields, str):
                         raise KeyError("record fields must be a list of mappings")
+                    frg1 = self.fragment(entry["name"])
                     for f in fields:  # type: Dict[str, str]
-                        p = has_types(f)
-                        for tp in p:
-                            if tp not in self.uses:
-                                self.uses[tp] = []
-                            if (entry["name"], f["name"]) not in self.uses[tp]:
-                                _, frg1 = urldefrag(t["name"])
-                                _, frg2 = urldefrag(f["name"])
-                                self.uses[tp].append((frg1, frg2))
-                            if (
-                                tp not in basicTypes
-                                and tp not in self.record_refs[entry["name"]]
-                            ):
-                                self.record_refs[entry["name"]].append(tp)
+                        key = (frg1, self.fragment(f["name"]))
+                        for tp in has_types(f):
+                            uses = self.uses.setdefault(tp, {})
+                            if key not in uses:
+                                uses[key] = None
+                            if tp not in basicTypes and tp not in refs:
+                                refs.append(tp)
             except KeyError:
-                _logger.error("Did not find 'type' in %s", t)
+                _logger.error("Did not find 'type' in %s", entry)
                 _logger.error("record refs is %s", self.record_refs)
                 raise
 
-        for entry in alltypes:
-            if entry["name"] in renderlist or (
+            if entry["name"] in renderset or (
                 (not renderlist)
                 and ("extends" not in entry)
                 and ("docParent" not in entry)
                 and ("docAfter" not in entry)
             ):
-                self.render_type(entry, 1)
+                torender.append(entry)
+
+        # Rendering follows record_refs into types that may come later in
+        # alltypes, so it can only start once all of them are collected.
+        for entry in torender:
+            self.render_type(entry, 1)
+
+    def fragment(self, uri: str) -> str:
+        frg = self.fragments.get(uri)
+        if frg is None:
+            frg = self.fragments[uri] = urldefrag(uri)[1]
+        return frg
+
+    def field_doc(self, desc: str) -> str:
+        if not desc.strip():
+            return ""
+        html = self.field_docs.get(desc)
+        if html is None:
+            html = self.field_docs[desc] = self.field_markdown(desc)
+        return html
 
     def typefmt(
         self,
@@ -269,8 +320,32 @@ class RenderType:
         redirects: Dict[str, str],
         nbsp: bool = False,
         jsonldPredicate: Optional[Dict[str, str]] = None,
+        drop_null: bool = False,
+    ) -> str:
+        # The type structures are not modified while rendering, so the
+        # formatted result only depends on the identity of the arguments.
+        # The cache entry holds on to tp and jsonldPredicate so that their
+        # ids can not be reused by other objects.  The leading "null" of an
+        # optional type is dropped here rather than by the caller, so that
+        # the key is the id of the schema's own list.
+        key = (id(tp), id(redirects), nbsp, id(jsonldPredicate), drop_null)
+        cached = self.typefmts.get(key)
+        if cached is not None:
+            return cached[2]
+        result = self.format_type(
+            tp[1:] if drop_null else tp, redirects, nbsp, jsonldPredicate
+        )
+        self.typefmts[key] = (tp, jsonldPredicate, result)
+        return result
+
+    def format_type(
+        self,
+        tp: Any,
+        redirects: Dict[str, str],
+        nbsp: bool = False,
+        jsonldPredicate: Optional[Dict[str, str]] = None,
     ) -> str:
-        if isinstance(tp, MutableSequence):
+        if isinstance(tp, list):
             if nbsp and len(tp) <= 3:
                 return "&nbsp;|&nbsp;".join(
                     [
@@ -284,8 +359,8 @@ class RenderType:
                     for n in tp
                 ]
             )
-        if isinstance(tp, MutableMapping):
-            if tp["type"] == "https://w3id.org/cwl/salad#array":
+        if isinstance(tp, dict):
+            if tp["type"] == _salad_array:
                 ar = "array&lt;{}&gt;".format(
                     self.typefmt(tp["items"], redirects, nbsp=True)
                 )
@@ -312,24 +387,18 @@ class RenderType:
                             self.typefmt(tp["items"], redirects),
                         )
                 return ar
-            if tp["type"] in (
-                "https://w3id.org/cwl/salad#record",
-                "https://w3id.org/cwl/salad#enum",
-            ):
+            if tp["type"] in (_salad_record, _salad_enum):
                 frg = avro_type_name(tp["name"])
                 if tp["name"] in redirects:
                     return """<a href="{}">{}</a>""".format(redirects[tp["name"]], frg)
                 if tp["name"] in self.typemap:
                     return """<a href="#{}">{}</a>""".format(to_id(frg), frg)
-                if (
-                    tp["type"] == "https://w3id.org/cwl/salad#enum"
-                    and len(tp["symbols"]) == 1
-                ):
+                if tp["type"] == _salad_enum and len(tp["symbols"]) == 1:
                     return "constant value <code>{}</code>".format(
                         schema.avro_field_name(tp["symbols"][0])
                     )
                 return frg
-            if isinstance(tp["type"], MutableMapping):
+            if isinstance(tp["type"], dict):
                 return self.typefmt(tp["type"], redirects)
         else:
             if str(tp) in redirects:
@@ -338,26 +407,40 @@ class RenderType:
                 return """<a href="{}">{}</a>""".format(
                     self.primitiveType, avro_type_name(str(tp))
                 )
-            frg2 = urldefrag(tp)[1]
+            frg2 = self.fragment(tp)
             if frg2 != "":
                 tp = frg2
             return """<a href="#{}">{}</a>""".format(to_id(tp), tp)
         raise SchemaSaladException("We should not be here!")
 
     def render_type(self, f: Dict[str, Any], depth: int) -> None:
+        pending = [(f, depth)]
+        while pending:
+            f, depth = pending.pop()
+            # Push in reverse so that types are rendered in depth-first order.
+            pending.extend(reversed(self.render_one(f, depth)))
+
+    def render_one(
+        self, f: Dict[str, Any], depth: int
+    ) -> List[Tuple[Dict[str, Any], int]]:
         if f["name"] in self.rendered or f["name"] in self.redirects:
-            return
+            return []
         self.rendered.add(f["name"])
 
         if f.get("abstract"):
-            return
+            return []
 
         if "doc" not in f:
             f["doc"] = ""
 
-        f["type"] = copy.deepcopy(f)
+        # Only the type itself and its field entries are modified below, so
+        # copy just those layers instead of the whole nested structure.
+        g = dict(f)
+        if "fields" in g:
+            g["fields"] = [dict(field) for field in g["fields"]]
+        f["type"] = g
         f["doc"] = ""
-        f = f["type"]
+        f = g
 
         if "doc" not in f:
             f["doc"] = ""
@@ -372,7 +455,7 @@ class RenderType:
         extendsfrom(f, ex)
 
         enumDesc = {}
-        if f["type"] == "enum" and isinstance(f["doc"], MutableSequence):
+        if f["type"] == "enum" and isinstance(f["doc"], list):
             for e in ex:
                 for i in e["doc"]:
                     idx = i.find(":")
@@ -399,7 +482,7 @@ class RenderType:
                 lines.append(line)
             f["doc"] = "\n".join(lines)
 
-            frg = urldefrag(f["name"])[1]
+            frg = self.fragment(f["name"])
             num = self.toc.add_entry(depth, frg)
             doc = "{} {} {}\n".format(("#" * depth), num, frg)
         else:
@@ -417,11 +500,12 @@ class RenderType:
 
         doc = doc + "\n\n" + f["doc"]
 
-        doc = mistune.markdown(doc, renderer=MyRenderer())
+        parts = [self.markdown(doc)]
 
         if f["type"] == "record":
-            doc += "<h3>Fields</h3>"
-            doc += """
+            parts.append("<h3>Fields</h3>")
+            parts.append(
+                """
 <div class="responsive-table">
 <div class="row responsive-table-header">
 <div class="col-xs-3 col-lg-2">field</div>
@@ -429,108 +513,66 @@ class RenderType:
 <div class="col-xs-7 col-lg-3">type</div>
 <div class="col-xs-12 col-lg-6 description-header">description</div>
 </div>"""
+            )
             required = []
             optional = []
             for i in f.get("fields", []):
                 tp = i["type"]
-                if (
-                    isinstance(tp, MutableSequence)
-                    and tp[0] == "https://w3id.org/cwl/salad#null"
-                ):
+                if isinstance(tp, list) and tp[0] == _salad_null:
                     opt = False
-                    tp = tp[1:]
                 else:
                     opt = True
 
                 desc = i["doc"]
 
                 rfrg = schema.avro_field_name(i["name"])
-                tr = """
-<div class="row responsive-table-row">
-<div class="col-xs-3 col-lg-2"><code>{}</code></div>
-<div class="col-xs-2 col-lg-1">{}</div>
-<div class="col-xs-7 col-lg-3">{}</div>
-<div class="col-xs-12 col-lg-6 description-col">{}</div>
-</div>""".format(
+                tr = _field_row.format(
                     rfrg,
                     "required" if opt else "optional",
                     self.typefmt(
-                        tp, self.redirects, jsonldPredicate=i.get("jsonldPredicate")
+                        tp,
+                        self.redirects,
+                        jsonldPredicate=i.get("jsonldPredicate"),
+                        drop_null=not opt,
                     ),
-                    mistune.markdown(desc),
+                    self.field_doc(desc),
                 )
                 if opt:
                     required.append(tr)
                 else:
                     optional.append(tr)
-            for i in required + optional:
-                doc += i
-            doc += """</div>"""
+            parts.extend(required)
+            parts.extend(optional)
+            parts.append("""</div>""")
         elif f["type"] == "enum":
-            doc += "<h3>Symbols</h3>"
-            doc += """<table class="table table-striped">"""
-            doc += "<tr><th>symbol</th><th>description</th></tr>"
+            parts.append("<h3>Symbols</h3>")
+            parts.append("""<table class="table table-striped">""")
+            parts.append("<tr><th>symbol</th><th>description</th></tr>")
             for e in ex:
                 for i in e.get("symbols", []):
-                    doc += "<tr>"
                     efrg = schema.avro_field_name(i)
-                    doc += "<td><code>{}</code></td><td>{}</td>".format(
-                        efrg, enumDesc.get(efrg, "")
+                    parts.append(
+                        "<tr><td><code>{}</code></td><td>{}</td></tr>".format(
+                            efrg, enumDesc.get(efrg, "")
+                        )
                     )
-                    doc += "</tr>"
-            doc += """</table>"""
-        f["doc"] = doc
+            parts.append("""</table>""")
+        f["doc"] = "".join(parts)
 
-        self.typedoc.write(f["doc"])
+        self.typedoc.append(f["doc"])
 
         subs = self.docParent.get(f["name"], []) + self.record_refs.get(f["name"], [])
         if len(subs) == 1:
-            self.render_type(self.typemap[subs[0]], depth)
+            children = [(self.typemap[subs[0]], depth)]
         else:
-            for s in subs:
-                self.render_type(self.typemap[s], depth + 1)
+            children = [(self.typemap[s], depth + 1) for s in subs]
 
         for s in self.docAfter.get(f["name"], []):
-            self.render_type(self.typemap[s], depth)
-
-
-def avrold_doc(
-    j: List[Dict[str, Any]],
-    outdoc: Union[IO[Any], StreamWriter],
-    renderlist: List[str],
-    redirects: Dict[str, str],
-    brand: str,
-    brandlink: str,
-    primtype: str,
-    brandstyle: Optional[str] = None,
-    brandinverse: Optional[bool] = False,
-) -> None:
-    toc = ToC()
-    toc.start_numbering = False
+            children.append((self.typemap[s], depth))
+        return children
 
-    rt = RenderType(toc, j, renderlist, redirects, primtype)
-    content = rt.typedoc.getvalue()
-
-    if brandstyle is None:
-        bootstrap_url = (
-            "https://maxcdn.bootstrapcdn.com/bootstrap/3.3.4/css/bootstrap.min.css"
-        )
-        bootstrap_integrity = (
-            "sha384-604wwakM23pEysLJAhja8Lm42IIwYrJ0dEAqzFsj9pJ/P5buiujjywArgPCi8eoz"
-        )
-        brandstyle_template = (
-            '<link rel="stylesheet" href={} integrity={} crossorigin="anonymous">'
-        )
-        brandstyle = brandstyle_template.format(bootstrap_url, bootstrap_integrity)
 
-    picturefill_url = (
-        "https://cdn.rawgit.com/scottjehl/picturefill/3.0.2/dist/picturefill.min.js"
-    )
-    picturefill_integrity = (
-        "sha384-ZJsVW8YHHxQHJ+SJDncpN90d0EfAhPP+yA94n+EhSRzhcxfo84yMnNk+v37RGlWR"
-    )
-    outdoc.write(
-        """
+_html_head = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -544,15 +586,9 @@ def avrold_doc(
     <script src="{}"
         integrity="{}"
         crossorigin="anonymous" async></script>
-    """.format(
-            brandstyle, picturefill_url, picturefill_integrity
-        )
-    )
-
-    outdoc.write(f"<title>{rt.title}</title>")
+    """
 
-    outdoc.write(
-        """
+_html_style = """
     <style>
     :target {
       padding-top: 61px;
@@ -618,67 +654,95 @@ def avrold_doc(
     </head>
     <body>
     """
-    )
 
-    navbar_extraclass = "navbar-inverse" if brandinverse else ""
-    outdoc.write(
-        """
+_html_navbar = """
       <nav class="navbar navbar-default navbar-fixed-top {}">
         <div class="container">
           <div class="navbar-header">
             <a class="navbar-brand" href="{}">{}</a>
-    """.format(
-            navbar_extraclass, brandlink, brand
-        )
-    )
+    """
 
-    if "<!--ToC-->" in content:
-        content = content.replace("<!--ToC-->", toc.contents("toc"))
-        outdoc.write(
-            """
+_html_toc_link = """
                 <ul class="nav navbar-nav">
                   <li><a href="#toc">Table of contents</a></li>
                 </ul>
         """
-        )
 
-    outdoc.write(
-        """
+_html_main_open = """
           </div>
         </div>
       </nav>
-    """
-    )
 
-    outdoc.write(
-        """
     <div class="container">
-    """
-    )
 
-    outdoc.write(
-        """
     <div class="row">
-    """
-    )
 
-    outdoc.write(
-        """
     <div class="col-md-12" role="main" id="main">"""
-    )
-
-    outdoc.write(content)
-
-    outdoc.write("""</div>""")
 
-    outdoc.write(
-        """
+_html_main_close = """</div>
     </div>
     </div>
     </body>
     </html>"""
+
+
+def avrold_doc(
+    j: List[Dict[str, Any]],
+    outdoc: Union[IO[Any], StreamWriter],
+    renderlist: List[str],
+    redirects: Dict[str, str],
+    brand: str,
+    brandlink: str,
+    primtype: str,
+    brandstyle: Optional[str] = None,
+    brandinverse: Optional[bool] = False,
+) -> None:
+    toc = ToC()
+    toc.start_numbering = False
+
+    rt = RenderType(toc, j, renderlist, redirects, primtype)
+    has_toc = any("<!--ToC-->" in chunk for chunk in rt.typedoc)
+
+    if brandstyle is None:
+        bootstrap_url = (
+            "https://maxcdn.bootstrapcdn.com/bootstrap/3.3.4/css/bootstrap.min.css"
+        )
+        bootstrap_integrity = (
+            "sha384-604wwakM23pEysLJAhja8Lm42IIwYrJ0dEAqzFsj9pJ/P5buiujjywArgPCi8eoz"
+        )
+        brandstyle_template = (
+            '<link rel="stylesheet" href={} integrity={} crossorigin="anonymous">'
+        )
+        brandstyle = brandstyle_template.format(bootstrap_url, bootstrap_integrity)
+
+    picturefill_url = (
+        "https://cdn.rawgit.com/scottjehl/picturefill/3.0.2/dist/picturefill.min.js"
+    )
+    picturefill_integrity = (
+        "sha384-ZJsVW8YHHxQHJ+SJDncpN90d0EfAhPP+yA94n+EhSRzhcxfo84yMnNk+v37RGlWR"
+    )
+    navbar_extraclass = "navbar-inverse" if brandinverse else ""
+    outdoc.write(
+        "".join(
+            [
+                _html_head.format(brandstyle, picturefill_url, picturefill_integrity),
+                f"<title>{rt.title}</title>",
+                _html_style,
+                _html_navbar.format(navbar_extraclass, brandlink, brand),
+                _html_toc_link if has_toc else "",
+                _html_main_open,
+            ]
+        )
     )
 
+    toc_contents = toc.contents("toc") if has_toc else ""
+    for chunk in rt.typedoc:
+        if has_toc and "<!--ToC-->" in chunk:
+            chunk = chunk.replace("<!--ToC-->", toc_contents)
+        outdoc.write(chunk)
+
+    outdoc.write(_html_main_close)
+
 
 def main() -> None:
     parser = argparse.ArgumentParser()
@@ -723,22 +787,32 @@ def makedoc(args: argparse.Namespace) -> None:
     for r in args.redirect or []:
         redirect[r.split("=")[0]] = r.split("=")[1]
     renderlist = args.only if args.only else []
-    stdout = (
-        TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
-        if sys.stdout.encoding != "UTF-8"
-        else cast(TextIOWrapper, sys.stdout)
-    )  # type: Union[TextIOWrapper, StreamWriter]
-    avrold_doc(
-        s,
-        stdout,
-        renderlist,
-        redirect,
-        args.brand,
-        args.brandlink,
-        args.primtype,
-        brandstyle=args.brandstyle,
-        brandinverse=args.brandinverse,
-    )
+    # avrold_doc issues many small writes, so hand them to sys.stdout.buffer
+    # through a wrapper that is neither line buffered nor write-through.
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        sys.stdout.flush()
+        stdout = TextIOWrapper(
+            buffer, encoding="utf-8", write_through=False
+        )  # type: Union[TextIO, StreamWriter]
+    else:
+        stdout = sys.stdout
+    try:
+        avrold_doc(
+            s,
+            stdout,
+            renderlist,
+            redirect,
+            args.brand,
+            args.brandlink,
+            args.primtype,
+            brandstyle=args.brandstyle,
+            brandinverse=args.brandinverse,
+        )
+    finally:
+        if isinstance(stdout, TextIOWrapper) and stdout is not sys.stdout:
+            # Flush and let go of sys.stdout.buffer without closing it.
+            stdout.detach()
 
 
 if __name__ == "__main__":
@@ -9,10 +9,12 @@ import re
 import tempfile
 import uuid as _uuid__  # pylint: disable=unused-import # noqa: F401
 from io import StringIO
+from types import MappingProxyType
 from typing import (
     Any,
     Dict,
     List,
+    Mapping,
     MutableMapping,
     MutableSequence,
     Optional,
@@ -31,11 +33,19 @@ from schema_salad.exceptions import SchemaSaladException, ValidationException
 from schema_salad.fetcher import DefaultFetcher, Fetcher
 from schema_salad.sourceline import SourceLine, add_lc_filename
 
-_vocab = {}  # type: Dict[str, str]
-_rvocab = {}  # type: Dict[str, str]
+_vocab = MappingProxyType({})  # type: Mapping[str, str]
+_rvocab = MappingProxyType({})  # type: Mapping[str, str]
+
+
+_SaveSpec = Tuple[str, str, bool, Optional[Tuple[bool, Optional[int]]]]
 
 
 class Savable:
+    __slots__ = ()
+
+    _field_loaders = ()  # type: Tuple[Tuple[str, _Loader, bool, str], ...]
+    _save_specs = ()  # type: Tuple[_SaveSpec, ...]
+
     @classmethod
     def fromDoc(cls, _doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> Savable
@@ -86,15 +96,34 @@ class LoadingOptions:
         else:
             self.fetcher = fetcher
 
-        self.vocab = _vocab
-        self.rvocab = _rvocab
+        self.vocab = _vocab  # type: Mapping[str, str]
+        self.rvocab = _rvocab  # type: Mapping[str, str]
 
         if namespaces is not None:
-            self.vocab = self.vocab.copy()
-            self.rvocab = self.rvocab.copy()
+            vocab = dict(self.vocab)
+            rvocab = dict(self.rvocab)
             for k, v in namespaces.items():
-                self.vocab[k] = v
-                self.rvocab[v] = k
+                vocab[k] = v
+                rvocab[v] = k
+            self.vocab = vocab
+            self.rvocab = rvocab
+
+    def __getstate__(self):  # type: () -> Dict[str, Any]
+        # The shared read-only vocabularies cannot be pickled or deep
+        # copied; __setstate__ puts them back.
+        state = self.__dict__.copy()
+        if self.vocab is _vocab:
+            state["vocab"] = None
+        if self.rvocab is _rvocab:
+            state["rvocab"] = None
+        return state
+
+    def __setstate__(self, state):  # type: (Dict[str, Any]) -> None
+        self.__dict__.update(state)
+        if self.vocab is None:
+            self.vocab = _vocab
+        if self.rvocab is None:
+            self.rvocab = _rvocab
 
 
 def load_field(val, fieldtype, baseuri, loadingOptions):
@@ -257,10 +286,41 @@ class _ArrayLoader(_Loader):
         r = []  # type: List[Any]
         errors = []  # type: List[SchemaSaladException]
         for i in range(0, len(doc)):
+            val = doc[i]
             try:
-                lf = load_field(
-                    doc[i], _UnionLoader((self, self.items)), baseuri, loadingOptions
-                )
+                if isinstance(val, MutableSequence) or (
+                    isinstance(val, MutableMapping)
+                    and ("$import" in val or "$include" in val)
+                ):
+                    lf = load_field(
+                        doc[i],
+                        _UnionLoader((self, self.items)),
+                        baseuri,
+                        loadingOptions,
+                    )
+                else:
+                    # Same as the union above, without first failing to load
+                    # the scalar or mapping as a nested list.
+                    try:
+                        lf = self.items.load(val, baseuri, loadingOptions)
+                    except ValidationException as e:
+                        raise ValidationException(
+                            "",
+                            None,
+                            [
+                                ValidationException(
+                                    f"tried {self.__class__.__name__} but",
+                                    None,
+                                    [ValidationException("Expected a list")],
+                                ),
+                                ValidationException(
+                                    f"tried {self.items.__class__.__name__} but",
+                                    None,
+                                    [e],
+                                ),
+                            ],
+                            "-",
+                        )
                 if isinstance(lf, MutableSequence):
                     r.extend(lf)
                 else:
@@ -589,7 +649,7 @@ def file_uri(path, split_frag=False):  # type: (str, bool) -> str
         return f"file://{urlpath}{frag}"
 
 
-def prefix_url(url, namespaces):  # type: (str, Dict[str, str]) -> str
+def prefix_url(url, namespaces):  # type: (str, Mapping[str, str]) -> str
     for k, v in namespaces.items():
         if url.startswith(v):
             return k + ":" + url[len(v) :]
@@ -634,13 +694,15 @@ def save_relative_uri(uri, base_url, scoped_id, ref_scope, relative_uris):
 
 
 class Documented(Savable):
-    pass
+    __slots__ = ()
 
 
 class RecordField(Documented):
     """
 A field of a record.
     """
+    __slots__ = ('doc', 'name', 'type', 'extension_fields', 'loadingOptions')
+
     def __init__(
         self,
         name,  # type: Any
@@ -650,14 +712,8 @@ A field of a record.
         loadingOptions=None  # type: Optional[LoadingOptions]
     ):  # type: (...) -> None
 
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
         self.doc = doc
         self.name = name
         self.type = type
@@ -666,10 +722,7 @@ A field of a record.
     def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> RecordField
 
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
+        _doc = doc
         _errors__ = []
         if 'name' in _doc:
             try:
@@ -692,31 +745,23 @@ A field of a record.
             else:
                 raise ValidationException("Missing name")
         baseuri = name
-        if 'doc' in _doc:
+
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
             try:
-                doc = load_field(_doc.get(
-                    'doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
             except ValidationException as e:
                 _errors__.append(
                     ValidationException(
-                        "the `doc` field is not valid because:",
-                        SourceLine(_doc, 'doc', str),
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
                         [e]
                     )
                 )
-        else:
-            doc = None
-        try:
-            type = load_field(_doc.get(
-                'type'), typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `type` field is not valid because:",
-                    SourceLine(_doc, 'type', str),
-                    [e]
-                )
-            )
 
         extension_fields = CommentedMap()
         for k in _doc.keys():
@@ -739,7 +784,7 @@ A field of a record.
 
         if _errors__:
             raise ValidationException("Trying 'RecordField'", None, _errors__)
-        return cls(doc=doc, name=name, type=type, extension_fields=extension_fields, loadingOptions=loadingOptions)
+        return cls(name=name, extension_fields=extension_fields, loadingOptions=loadingOptions, **_loaded)
 
     def save(self, top=False, base_url="", relative_uris=True):
         # type: (bool, str, bool) -> Dict[str, Any]
@@ -747,29 +792,27 @@ A field of a record.
         for ef in self.extension_fields:
             r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
 
-        if self.name is not None:
-            u = save_relative_uri(
-                self.name,
-                base_url,
-                True,
-                None,
-                relative_uris)
-            if u:
-                r['name'] = u
-
-        if self.doc is not None:
-            r['doc'] = save(
-                self.doc,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.type is not None:
-            r['type'] = save(
-                self.type,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
+        _id_base = self.name
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
 
         # top refers to the directory level
         if top:
@@ -779,10 +822,17 @@ A field of a record.
                 r["$schemas"] = self.loadingOptions.schemas
         return r
 
-    attrs = frozenset(['doc', 'name', 'type'])
+    attrs = frozenset(('doc', 'name', 'type'))
+    _save_specs = (
+        ('name', 'name', False, (True, None)),
+        ('doc', 'doc', True, None),
+        ('type', 'type', True, None),
+    )  # type: Tuple[_SaveSpec, ...]
 
 
 class RecordSchema(Savable):
+    __slots__ = ('fields', 'type', 'extension_fields', 'loadingOptions')
+
     def __init__(
         self,
         type,  # type: Any
@@ -791,14 +841,8 @@ class RecordSchema(Savable):
         loadingOptions=None  # type: Optional[LoadingOptions]
     ):  # type: (...) -> None
 
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
         self.fields = fields
         self.type = type
 
@@ -806,36 +850,25 @@ class RecordSchema(Savable):
     def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> RecordSchema
 
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
+        _doc = doc
         _errors__ = []
-        if 'fields' in _doc:
+
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
             try:
-                fields = load_field(_doc.get(
-                    'fields'), idmap_fields_union_of_None_type_or_array_of_RecordFieldLoader, baseuri, loadingOptions)
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
             except ValidationException as e:
                 _errors__.append(
                     ValidationException(
-                        "the `fields` field is not valid because:",
-                        SourceLine(_doc, 'fields', str),
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
                         [e]
                     )
                 )
-        else:
-            fields = None
-        try:
-            type = load_field(_doc.get(
-                'type'), typedsl_enum_d9cba076fca539106791a4f46d198c7fcfbdb779Loader_2, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `type` field is not valid because:",
-                    SourceLine(_doc, 'type', str),
-                    [e]
-                )
-            )
 
         extension_fields = CommentedMap()
         for k in _doc.keys():
@@ -858,7 +891,7 @@ class RecordSchema(Savable):
 
         if _errors__:
             raise ValidationException("Trying 'RecordSchema'", None, _errors__)
-        return cls(fields=fields, type=type, extension_fields=extension_fields, loadingOptions=loadingOptions)
+        return cls(extension_fields=extension_fields, loadingOptions=loadingOptions, **_loaded)
 
     def save(self, top=False, base_url="", relative_uris=True):
         # type: (bool, str, bool) -> Dict[str, Any]
@@ -866,19 +899,27 @@ class RecordSchema(Savable):
         for ef in self.extension_fields:
             r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
 
-        if self.fields is not None:
-            r['fields'] = save(
-                self.fields,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
-
-        if self.type is not None:
-            r['type'] = save(
-                self.type,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
+        _id_base = base_url
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
 
         # top refers to the directory level
         if top:
@@ -888,7 +929,11 @@ class RecordSchema(Savable):
                 r["$schemas"] = self.loadingOptions.schemas
         return r
 
-    attrs = frozenset(['fields', 'type'])
+    attrs = frozenset(('fields', 'type'))
+    _save_specs = (
+        ('fields', 'fields', False, None),
+        ('type', 'type', False, None),
+    )  # type: Tuple[_SaveSpec, ...]
 
 
 class EnumSchema(Savable):
@@ -896,6 +941,8 @@ class EnumSchema(Savable):
 Define an enumerated type.
 
     """
+    __slots__ = ('symbols', 'type', 'extension_fields', 'loadingOptions')
+
     def __init__(
         self,
         symbols,  # type: Any
@@ -904,14 +951,8 @@ Define an enumerated type.
         loadingOptions=None  # type: Optional[LoadingOptions]
     ):  # type: (...) -> None
 
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
         self.symbols = symbols
         self.type = type
 
@@ -919,33 +960,25 @@ Define an enumerated type.
     def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> EnumSchema
 
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
+        _doc = doc
         _errors__ = []
-        try:
-            symbols = load_field(_doc.get(
-                'symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `symbols` field is not valid because:",
-                    SourceLine(_doc, 'symbols', str),
-                    [e]
-                )
-            )
-        try:
-            type = load_field(_doc.get(
-                'type'), typedsl_enum_d961d79c225752b9fadb617367615ab176b47d77Loader_2, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `type` field is not valid because:",
-                    SourceLine(_doc, 'type', str),
-                    [e]
+
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
+            try:
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
+            except ValidationException as e:
+                _errors__.append(
+                    ValidationException(
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
+                        [e]
+                    )
                 )
-            )
 
         extension_fields = CommentedMap()
         for k in _doc.keys():
@@ -968,7 +1001,7 @@ Define an enumerated type.
 
         if _errors__:
             raise ValidationException("Trying 'EnumSchema'", None, _errors__)
-        return cls(symbols=symbols, type=type, extension_fields=extension_fields, loadingOptions=loadingOptions)
+        return cls(extension_fields=extension_fields, loadingOptions=loadingOptions, **_loaded)
 
     def save(self, top=False, base_url="", relative_uris=True):
         # type: (bool, str, bool) -> Dict[str, Any]
@@ -976,22 +1009,27 @@ Define an enumerated type.
         for ef in self.extension_fields:
             r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
 
-        if self.symbols is not None:
-            u = save_relative_uri(
-                self.symbols,
-                base_url,
-                True,
-                None,
-                relative_uris)
-            if u:
-                r['symbols'] = u
-
-        if self.type is not None:
-            r['type'] = save(
-                self.type,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
+        _id_base = base_url
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
 
         # top refers to the directory level
         if top:
@@ -1001,10 +1039,16 @@ Define an enumerated type.
                 r["$schemas"] = self.loadingOptions.schemas
         return r
 
-    attrs = frozenset(['symbols', 'type'])
+    attrs = frozenset(('symbols', 'type'))
+    _save_specs = (
+        ('symbols', 'symbols', False, (True, None)),
+        ('type', 'type', False, None),
+    )  # type: Tuple[_SaveSpec, ...]
 
 
 class ArraySchema(Savable):
+    __slots__ = ('items', 'type', 'extension_fields', 'loadingOptions')
+
     def __init__(
         self,
         items,  # type: Any
@@ -1013,14 +1057,8 @@ class ArraySchema(Savable):
         loadingOptions=None  # type: Optional[LoadingOptions]
     ):  # type: (...) -> None
 
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
         self.items = items
         self.type = type
 
@@ -1028,33 +1066,25 @@ class ArraySchema(Savable):
     def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> ArraySchema
 
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
+        _doc = doc
         _errors__ = []
-        try:
-            items = load_field(_doc.get(
-                'items'), uri_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `items` field is not valid because:",
-                    SourceLine(_doc, 'items', str),
-                    [e]
-                )
-            )
-        try:
-            type = load_field(_doc.get(
-                'type'), typedsl_enum_d062602be0b4b8fd33e69e29a841317b6ab665bcLoader_2, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `type` field is not valid because:",
-                    SourceLine(_doc, 'type', str),
-                    [e]
+
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
+            try:
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
+            except ValidationException as e:
+                _errors__.append(
+                    ValidationException(
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
+                        [e]
+                    )
                 )
-            )
 
         extension_fields = CommentedMap()
         for k in _doc.keys():
@@ -1077,7 +1107,7 @@ class ArraySchema(Savable):
 
         if _errors__:
             raise ValidationException("Trying 'ArraySchema'", None, _errors__)
-        return cls(items=items, type=type, extension_fields=extension_fields, loadingOptions=loadingOptions)
+        return cls(extension_fields=extension_fields, loadingOptions=loadingOptions, **_loaded)
 
     def save(self, top=False, base_url="", relative_uris=True):
         # type: (bool, str, bool) -> Dict[str, Any]
@@ -1085,22 +1115,27 @@ class ArraySchema(Savable):
         for ef in self.extension_fields:
             r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
 
-        if self.items is not None:
-            u = save_relative_uri(
-                self.items,
-                base_url,
-                False,
-                2,
-                relative_uris)
-            if u:
-                r['items'] = u
-
-        if self.type is not None:
-            r['type'] = save(
-                self.type,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
+        _id_base = base_url
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
 
         # top refers to the directory level
         if top:
@@ -1110,7 +1145,11 @@ class ArraySchema(Savable):
                 r["$schemas"] = self.loadingOptions.schemas
         return r
 
-    attrs = frozenset(['items', 'type'])
+    attrs = frozenset(('items', 'type'))
+    _save_specs = (
+        ('items', 'items', False, (False, 2)),
+        ('type', 'type', False, None),
+    )  # type: Tuple[_SaveSpec, ...]
 
 
 class JsonldPredicate(Savable):
@@ -1119,6 +1158,8 @@ Attached to a record field to define how the parent record field is handled for
 URI resolution and JSON-LD context generation.
 
     """
+    __slots__ = ('_id', '_type', '_container', 'identity', 'noLinkCheck', 'mapSubject', 'mapPredicate', 'refScope', 'typeDSL', 'secondaryFilesDSL', 'subscope', 'extension_fields', 'loadingOptions')
+
     def __init__(
         self,
         _id=None,  # type: Any
@@ -1136,14 +1177,8 @@ URI resolution and JSON-LD context generation.
         loadingOptions=None  # type: Optional[LoadingOptions]
     ):  # type: (...) -> None
 
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
         self._id = _id
         self._type = _type
         self._container = _container
@@ -1160,165 +1195,25 @@ URI resolution and JSON-LD context generation.
     def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> JsonldPredicate
 
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
+        _doc = doc
         _errors__ = []
-        if '_id' in _doc:
-            try:
-                _id = load_field(_doc.get(
-                    '_id'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `_id` field is not valid because:",
-                        SourceLine(_doc, '_id', str),
-                        [e]
-                    )
-                )
-        else:
-            _id = None
-        if '_type' in _doc:
-            try:
-                _type = load_field(_doc.get(
-                    '_type'), union_of_None_type_or_strtype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `_type` field is not valid because:",
-                        SourceLine(_doc, '_type', str),
-                        [e]
-                    )
-                )
-        else:
-            _type = None
-        if '_container' in _doc:
-            try:
-                _container = load_field(_doc.get(
-                    '_container'), union_of_None_type_or_strtype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `_container` field is not valid because:",
-                        SourceLine(_doc, '_container', str),
-                        [e]
-                    )
-                )
-        else:
-            _container = None
-        if 'identity' in _doc:
-            try:
-                identity = load_field(_doc.get(
-                    'identity'), union_of_None_type_or_booltype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `identity` field is not valid because:",
-                        SourceLine(_doc, 'identity', str),
-                        [e]
-                    )
-                )
-        else:
-            identity = None
-        if 'noLinkCheck' in _doc:
-            try:
-                noLinkCheck = load_field(_doc.get(
-                    'noLinkCheck'), union_of_None_type_or_booltype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `noLinkCheck` field is not valid because:",
-                        SourceLine(_doc, 'noLinkCheck', str),
-                        [e]
-                    )
-                )
-        else:
-            noLinkCheck = None
-        if 'mapSubject' in _doc:
-            try:
-                mapSubject = load_field(_doc.get(
-                    'mapSubject'), union_of_None_type_or_strtype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `mapSubject` field is not valid because:",
-                        SourceLine(_doc, 'mapSubject', str),
-                        [e]
-                    )
-                )
-        else:
-            mapSubject = None
-        if 'mapPredicate' in _doc:
-            try:
-                mapPredicate = load_field(_doc.get(
-                    'mapPredicate'), union_of_None_type_or_strtype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `mapPredicate` field is not valid because:",
-                        SourceLine(_doc, 'mapPredicate', str),
-                        [e]
-                    )
-                )
-        else:
-            mapPredicate = None
-        if 'refScope' in _doc:
-            try:
-                refScope = load_field(_doc.get(
-                    'refScope'), union_of_None_type_or_inttype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `refScope` field is not valid because:",
-                        SourceLine(_doc, 'refScope', str),
-                        [e]
-                    )
-                )
-        else:
-            refScope = None
-        if 'typeDSL' in _doc:
-            try:
-                typeDSL = load_field(_doc.get(
-                    'typeDSL'), union_of_None_type_or_booltype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `typeDSL` field is not valid because:",
-                        SourceLine(_doc, 'typeDSL', str),
-                        [e]
-                    )
-                )
-        else:
-            typeDSL = None
-        if 'secondaryFilesDSL' in _doc:
-            try:
-                secondaryFilesDSL = load_field(_doc.get(
-                    'secondaryFilesDSL'), union_of_None_type_or_booltype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `secondaryFilesDSL` field is not valid because:",
-                        SourceLine(_doc, 'secondaryFilesDSL', str),
-                        [e]
-                    )
-                )
-        else:
-            secondaryFilesDSL = None
-        if 'subscope' in _doc:
+
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
             try:
-                subscope = load_field(_doc.get(
-                    'subscope'), union_of_None_type_or_strtype, baseuri, loadingOptions)
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
             except ValidationException as e:
                 _errors__.append(
                     ValidationException(
-                        "the `subscope` field is not valid because:",
-                        SourceLine(_doc, 'subscope', str),
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
                         [e]
                     )
                 )
-        else:
-            subscope = None
 
         extension_fields = CommentedMap()
         for k in _doc.keys():
@@ -1341,7 +1236,7 @@ URI resolution and JSON-LD context generation.
 
         if _errors__:
             raise ValidationException("Trying 'JsonldPredicate'", None, _errors__)
-        return cls(_id=_id, _type=_type, _container=_container, identity=identity, noLinkCheck=noLinkCheck, mapSubject=mapSubject, mapPredicate=mapPredicate, refScope=refScope, typeDSL=typeDSL, secondaryFilesDSL=secondaryFilesDSL, subscope=subscope, extension_fields=extension_fields, loadingOptions=loadingOptions)
+        return cls(extension_fields=extension_fields, loadingOptions=loadingOptions, **_loaded)
 
     def save(self, top=False, base_url="", relative_uris=True):
         # type: (bool, str, bool) -> Dict[str, Any]
@@ -1349,85 +1244,27 @@ URI resolution and JSON-LD context generation.
         for ef in self.extension_fields:
             r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
 
-        if self._id is not None:
-            u = save_relative_uri(
-                self._id,
-                base_url,
-                True,
-                None,
-                relative_uris)
-            if u:
-                r['_id'] = u
-
-        if self._type is not None:
-            r['_type'] = save(
-                self._type,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
-
-        if self._container is not None:
-            r['_container'] = save(
-                self._container,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
-
-        if self.identity is not None:
-            r['identity'] = save(
-                self.identity,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
-
-        if self.noLinkCheck is not None:
-            r['noLinkCheck'] = save(
-                self.noLinkCheck,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
-
-        if self.mapSubject is not None:
-            r['mapSubject'] = save(
-                self.mapSubject,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
-
-        if self.mapPredicate is not None:
-            r['mapPredicate'] = save(
-                self.mapPredicate,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
-
-        if self.refScope is not None:
-            r['refScope'] = save(
-                self.refScope,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
-
-        if self.typeDSL is not None:
-            r['typeDSL'] = save(
-                self.typeDSL,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
-
-        if self.secondaryFilesDSL is not None:
-            r['secondaryFilesDSL'] = save(
-                self.secondaryFilesDSL,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
-
-        if self.subscope is not None:
-            r['subscope'] = save(
-                self.subscope,
-                top=False,
-                base_url=base_url,
-                relative_uris=relative_uris)
+        _id_base = base_url
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
 
         # top refers to the directory level
         if top:
@@ -1437,10 +1274,25 @@ URI resolution and JSON-LD context generation.
                 r["$schemas"] = self.loadingOptions.schemas
         return r
 
-    attrs = frozenset(['_id', '_type', '_container', 'identity', 'noLinkCheck', 'mapSubject', 'mapPredicate', 'refScope', 'typeDSL', 'secondaryFilesDSL', 'subscope'])
+    attrs = frozenset(('_id', '_type', '_container', 'identity', 'noLinkCheck', 'mapSubject', 'mapPredicate', 'refScope', 'typeDSL', 'secondaryFilesDSL', 'subscope'))
+    _save_specs = (
+        ('_id', '_id', False, (True, None)),
+        ('_type', '_type', False, None),
+        ('_container', '_container', False, None),
+        ('identity', 'identity', False, None),
+        ('noLinkCheck', 'noLinkCheck', False, None),
+        ('mapSubject', 'mapSubject', False, None),
+        ('mapPredicate', 'mapPredicate', False, None),
+        ('refScope', 'refScope', False, None),
+        ('typeDSL', 'typeDSL', False, None),
+        ('secondaryFilesDSL', 'secondaryFilesDSL', False, None),
+        ('subscope', 'subscope', False, None),
+    )  # type: Tuple[_SaveSpec, ...]
 
 
 class SpecializeDef(Savable):
+    __slots__ = ('specializeFrom', 'specializeTo', 'extension_fields', 'loadingOptions')
+
     def __init__(
         self,
         specializeFrom,  # type: Any
@@ -1449,14 +1301,8 @@ class SpecializeDef(Savable):
         loadingOptions=None  # type: Optional[LoadingOptions]
     ):  # type: (...) -> None
 
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
         self.specializeFrom = specializeFrom
         self.specializeTo = specializeTo
 
@@ -1464,33 +1310,25 @@ class SpecializeDef(Savable):
     def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> SpecializeDef
 
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
+        _doc = doc
         _errors__ = []
-        try:
-            specializeFrom = load_field(_doc.get(
-                'specializeFrom'), uri_strtype_False_False_1, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `specializeFrom` field is not valid because:",
-                    SourceLine(_doc, 'specializeFrom', str),
-                    [e]
-                )
-            )
-        try:
-            specializeTo = load_field(_doc.get(
-                'specializeTo'), uri_strtype_False_False_1, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `specializeTo` field is not valid because:",
-                    SourceLine(_doc, 'specializeTo', str),
-                    [e]
+
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
+            try:
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
+            except ValidationException as e:
+                _errors__.append(
+                    ValidationException(
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
+                        [e]
+                    )
                 )
-            )
 
         extension_fields = CommentedMap()
         for k in _doc.keys():
@@ -1513,7 +1351,7 @@ class SpecializeDef(Savable):
 
         if _errors__:
             raise ValidationException("Trying 'SpecializeDef'", None, _errors__)
-        return cls(specializeFrom=specializeFrom, specializeTo=specializeTo, extension_fields=extension_fields, loadingOptions=loadingOptions)
+        return cls(extension_fields=extension_fields, loadingOptions=loadingOptions, **_loaded)
 
     def save(self, top=False, base_url="", relative_uris=True):
         # type: (bool, str, bool) -> Dict[str, Any]
@@ -1521,25 +1359,27 @@ class SpecializeDef(Savable):
         for ef in self.extension_fields:
             r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
 
-        if self.specializeFrom is not None:
-            u = save_relative_uri(
-                self.specializeFrom,
-                base_url,
-                False,
-                1,
-                relative_uris)
-            if u:
-                r['specializeFrom'] = u
-
-        if self.specializeTo is not None:
-            u = save_relative_uri(
-                self.specializeTo,
-                base_url,
-                False,
-                1,
-                relative_uris)
-            if u:
-                r['specializeTo'] = u
+        _id_base = base_url
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
 
         # top refers to the directory level
         if top:
@@ -1549,15 +1389,19 @@ class SpecializeDef(Savable):
                 r["$schemas"] = self.loadingOptions.schemas
         return r
 
-    attrs = frozenset(['specializeFrom', 'specializeTo'])
+    attrs = frozenset(('specializeFrom', 'specializeTo'))
+    _save_specs = (
+        ('specializeFrom', 'specializeFrom', False, (False, 1)),
+        ('specializeTo', 'specializeTo', False, (False, 1)),
+    )  # type: Tuple[_SaveSpec, ...]
 
 
 class NamedType(Savable):
-    pass
+    __slots__ = ()
 
 
 class DocType(Documented):
-    pass
+    __slots__ = ()
 
 
 class SchemaDefinedType(DocType):
@@ -1565,13 +1409,15 @@ class SchemaDefinedType(DocType):
 Abstract base for schema-defined types.
 
     """
-    pass
+    __slots__ = ()
 
 
 class SaladRecordField(RecordField):
     """
 A field of a record.
     """
+    __slots__ = ('jsonldPredicate', 'default')
+
     def __init__(
         self,
         name,  # type: Any
@@ -1583,14 +1429,8 @@ A field of a record.
         loadingOptions=None  # type: Optional[LoadingOptions]
     ):  # type: (...) -> None
 
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
         self.doc = doc
         self.name = name
         self.type = type
@@ -1601,10 +1441,7 @@ A field of a record.
     def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> SaladRecordField
 
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
+        _doc = doc
         _errors__ = []
         if 'name' in _doc:
             try:
@@ -1627,59 +1464,23 @@ A field of a record.
             else:
                 raise ValidationException("Missing name")
         baseuri = name
-        if 'doc' in _doc:
-            try:
-                doc = load_field(_doc.get(
-                    'doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `doc` field is not valid because:",
-                        SourceLine(_doc, 'doc', str),
-                        [e]
-                    )
-                )
-        else:
-            doc = None
-        try:
-            type = load_field(_doc.get(
-                'type'), typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `type` field is not valid because:",
-                    SourceLine(_doc, 'type', str),
-                    [e]
-                )
-            )
-        if 'jsonldPredicate' in _doc:
-            try:
-                jsonldPredicate = load_field(_doc.get(
-                    'jsonldPredicate'), union_of_None_type_or_strtype_or_JsonldPredicateLoader, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `jsonldPredicate` field is not valid because:",
-                        SourceLine(_doc, 'jsonldPredicate', str),
-                        [e]
-                    )
-                )
-        else:
-            jsonldPredicate = None
-        if 'default' in _doc:
+
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
             try:
-                default = load_field(_doc.get(
-                    'default'), union_of_None_type_or_Any_type, baseuri, loadingOptions)
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
             except ValidationException as e:
                 _errors__.append(
                     ValidationException(
-                        "the `default` field is not valid because:",
-                        SourceLine(_doc, 'default', str),
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
                         [e]
                     )
                 )
-        else:
-            default = None
 
         extension_fields = CommentedMap()
         for k in _doc.keys():
@@ -1702,7 +1503,7 @@ A field of a record.
 
         if _errors__:
             raise ValidationException("Trying 'SaladRecordField'", None, _errors__)
-        return cls(doc=doc, name=name, type=type, jsonldPredicate=jsonldPredicate, default=default, extension_fields=extension_fields, loadingOptions=loadingOptions)
+        return cls(name=name, extension_fields=extension_fields, loadingOptions=loadingOptions, **_loaded)
 
     def save(self, top=False, base_url="", relative_uris=True):
         # type: (bool, str, bool) -> Dict[str, Any]
@@ -1710,43 +1511,27 @@ A field of a record.
         for ef in self.extension_fields:
             r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
 
-        if self.name is not None:
-            u = save_relative_uri(
-                self.name,
-                base_url,
-                True,
-                None,
-                relative_uris)
-            if u:
-                r['name'] = u
-
-        if self.doc is not None:
-            r['doc'] = save(
-                self.doc,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.type is not None:
-            r['type'] = save(
-                self.type,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.jsonldPredicate is not None:
-            r['jsonldPredicate'] = save(
-                self.jsonldPredicate,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.default is not None:
-            r['default'] = save(
-                self.default,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
+        _id_base = self.name
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
 
         # top refers to the directory level
         if top:
@@ -1756,10 +1541,19 @@ A field of a record.
                 r["$schemas"] = self.loadingOptions.schemas
         return r
 
-    attrs = frozenset(['doc', 'name', 'type', 'jsonldPredicate', 'default'])
+    attrs = frozenset(('doc', 'name', 'type', 'jsonldPredicate', 'default'))
+    _save_specs = (
+        ('name', 'name', False, (True, None)),
+        ('doc', 'doc', True, None),
+        ('type', 'type', True, None),
+        ('jsonldPredicate', 'jsonldPredicate', True, None),
+        ('default', 'default', True, None),
+    )  # type: Tuple[_SaveSpec, ...]
 
 
 class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
+    __slots__ = ('name', 'inVocab', 'doc', 'docParent', 'docChild', 'docAfter', 'jsonldPredicate', 'documentRoot', 'abstract', 'extends', 'specialize')
+
     def __init__(
         self,
         name,  # type: Any
@@ -1779,14 +1573,8 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
         loadingOptions=None  # type: Optional[LoadingOptions]
     ):  # type: (...) -> None
 
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
         self.name = name
         self.inVocab = inVocab
         self.fields = fields
@@ -1805,10 +1593,7 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
     def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> SaladRecordSchema
 
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
+        _doc = doc
         _errors__ = []
         if 'name' in _doc:
             try:
@@ -1831,171 +1616,23 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
             else:
                 raise ValidationException("Missing name")
         baseuri = name
-        if 'inVocab' in _doc:
-            try:
-                inVocab = load_field(_doc.get(
-                    'inVocab'), union_of_None_type_or_booltype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `inVocab` field is not valid because:",
-                        SourceLine(_doc, 'inVocab', str),
-                        [e]
-                    )
-                )
-        else:
-            inVocab = None
-        if 'fields' in _doc:
-            try:
-                fields = load_field(_doc.get(
-                    'fields'), idmap_fields_union_of_None_type_or_array_of_SaladRecordFieldLoader, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `fields` field is not valid because:",
-                        SourceLine(_doc, 'fields', str),
-                        [e]
-                    )
-                )
-        else:
-            fields = None
-        try:
-            type = load_field(_doc.get(
-                'type'), typedsl_enum_d9cba076fca539106791a4f46d198c7fcfbdb779Loader_2, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `type` field is not valid because:",
-                    SourceLine(_doc, 'type', str),
-                    [e]
-                )
-            )
-        if 'doc' in _doc:
-            try:
-                doc = load_field(_doc.get(
-                    'doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `doc` field is not valid because:",
-                        SourceLine(_doc, 'doc', str),
-                        [e]
-                    )
-                )
-        else:
-            doc = None
-        if 'docParent' in _doc:
-            try:
-                docParent = load_field(_doc.get(
-                    'docParent'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `docParent` field is not valid because:",
-                        SourceLine(_doc, 'docParent', str),
-                        [e]
-                    )
-                )
-        else:
-            docParent = None
-        if 'docChild' in _doc:
-            try:
-                docChild = load_field(_doc.get(
-                    'docChild'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_None, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `docChild` field is not valid because:",
-                        SourceLine(_doc, 'docChild', str),
-                        [e]
-                    )
-                )
-        else:
-            docChild = None
-        if 'docAfter' in _doc:
-            try:
-                docAfter = load_field(_doc.get(
-                    'docAfter'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `docAfter` field is not valid because:",
-                        SourceLine(_doc, 'docAfter', str),
-                        [e]
-                    )
-                )
-        else:
-            docAfter = None
-        if 'jsonldPredicate' in _doc:
-            try:
-                jsonldPredicate = load_field(_doc.get(
-                    'jsonldPredicate'), union_of_None_type_or_strtype_or_JsonldPredicateLoader, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `jsonldPredicate` field is not valid because:",
-                        SourceLine(_doc, 'jsonldPredicate', str),
-                        [e]
-                    )
-                )
-        else:
-            jsonldPredicate = None
-        if 'documentRoot' in _doc:
-            try:
-                documentRoot = load_field(_doc.get(
-                    'documentRoot'), union_of_None_type_or_booltype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `documentRoot` field is not valid because:",
-                        SourceLine(_doc, 'documentRoot', str),
-                        [e]
-                    )
-                )
-        else:
-            documentRoot = None
-        if 'abstract' in _doc:
-            try:
-                abstract = load_field(_doc.get(
-                    'abstract'), union_of_None_type_or_booltype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `abstract` field is not valid because:",
-                        SourceLine(_doc, 'abstract', str),
-                        [e]
-                    )
-                )
-        else:
-            abstract = None
-        if 'extends' in _doc:
-            try:
-                extends = load_field(_doc.get(
-                    'extends'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_1, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `extends` field is not valid because:",
-                        SourceLine(_doc, 'extends', str),
-                        [e]
-                    )
-                )
-        else:
-            extends = None
-        if 'specialize' in _doc:
+
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
             try:
-                specialize = load_field(_doc.get(
-                    'specialize'), idmap_specialize_union_of_None_type_or_array_of_SpecializeDefLoader, baseuri, loadingOptions)
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
             except ValidationException as e:
                 _errors__.append(
                     ValidationException(
-                        "the `specialize` field is not valid because:",
-                        SourceLine(_doc, 'specialize', str),
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
                         [e]
                     )
                 )
-        else:
-            specialize = None
 
         extension_fields = CommentedMap()
         for k in _doc.keys():
@@ -2018,7 +1655,7 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
 
         if _errors__:
             raise ValidationException("Trying 'SaladRecordSchema'", None, _errors__)
-        return cls(name=name, inVocab=inVocab, fields=fields, type=type, doc=doc, docParent=docParent, docChild=docChild, docAfter=docAfter, jsonldPredicate=jsonldPredicate, documentRoot=documentRoot, abstract=abstract, extends=extends, specialize=specialize, extension_fields=extension_fields, loadingOptions=loadingOptions)
+        return cls(name=name, extension_fields=extension_fields, loadingOptions=loadingOptions, **_loaded)
 
     def save(self, top=False, base_url="", relative_uris=True):
         # type: (bool, str, bool) -> Dict[str, Any]
@@ -2026,111 +1663,27 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
         for ef in self.extension_fields:
             r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
 
-        if self.name is not None:
-            u = save_relative_uri(
-                self.name,
-                base_url,
-                True,
-                None,
-                relative_uris)
-            if u:
-                r['name'] = u
-
-        if self.inVocab is not None:
-            r['inVocab'] = save(
-                self.inVocab,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.fields is not None:
-            r['fields'] = save(
-                self.fields,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.type is not None:
-            r['type'] = save(
-                self.type,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.doc is not None:
-            r['doc'] = save(
-                self.doc,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.docParent is not None:
-            u = save_relative_uri(
-                self.docParent,
-                self.name,
-                False,
-                None,
-                relative_uris)
-            if u:
-                r['docParent'] = u
-
-        if self.docChild is not None:
-            u = save_relative_uri(
-                self.docChild,
-                self.name,
-                False,
-                None,
-                relative_uris)
-            if u:
-                r['docChild'] = u
-
-        if self.docAfter is not None:
-            u = save_relative_uri(
-                self.docAfter,
-                self.name,
-                False,
-                None,
-                relative_uris)
-            if u:
-                r['docAfter'] = u
-
-        if self.jsonldPredicate is not None:
-            r['jsonldPredicate'] = save(
-                self.jsonldPredicate,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.documentRoot is not None:
-            r['documentRoot'] = save(
-                self.documentRoot,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.abstract is not None:
-            r['abstract'] = save(
-                self.abstract,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.extends is not None:
-            u = save_relative_uri(
-                self.extends,
-                self.name,
-                False,
-                1,
-                relative_uris)
-            if u:
-                r['extends'] = u
-
-        if self.specialize is not None:
-            r['specialize'] = save(
-                self.specialize,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
+        _id_base = self.name
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
 
         # top refers to the directory level
         if top:
@@ -2140,7 +1693,22 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                 r["$schemas"] = self.loadingOptions.schemas
         return r
 
-    attrs = frozenset(['name', 'inVocab', 'fields', 'type', 'doc', 'docParent', 'docChild', 'docAfter', 'jsonldPredicate', 'documentRoot', 'abstract', 'extends', 'specialize'])
+    attrs = frozenset(('name', 'inVocab', 'fields', 'type', 'doc', 'docParent', 'docChild', 'docAfter', 'jsonldPredicate', 'documentRoot', 'abstract', 'extends', 'specialize'))
+    _save_specs = (
+        ('name', 'name', False, (True, None)),
+        ('inVocab', 'inVocab', True, None),
+        ('fields', 'fields', True, None),
+        ('type', 'type', True, None),
+        ('doc', 'doc', True, None),
+        ('docParent', 'docParent', True, (False, None)),
+        ('docChild', 'docChild', True, (False, None)),
+        ('docAfter', 'docAfter', True, (False, None)),
+        ('jsonldPredicate', 'jsonldPredicate', True, None),
+        ('documentRoot', 'documentRoot', True, None),
+        ('abstract', 'abstract', True, None),
+        ('extends', 'extends', True, (False, 1)),
+        ('specialize', 'specialize', True, None),
+    )  # type: Tuple[_SaveSpec, ...]
 
 
 class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
@@ -2148,6 +1716,8 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
 Define an enumerated type.
 
     """
+    __slots__ = ('name', 'inVocab', 'doc', 'docParent', 'docChild', 'docAfter', 'jsonldPredicate', 'documentRoot', 'extends')
+
     def __init__(
         self,
         name,  # type: Any
@@ -2165,14 +1735,8 @@ Define an enumerated type.
         loadingOptions=None  # type: Optional[LoadingOptions]
     ):  # type: (...) -> None
 
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
         self.name = name
         self.inVocab = inVocab
         self.symbols = symbols
@@ -2189,10 +1753,7 @@ Define an enumerated type.
     def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> SaladEnumSchema
 
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
+        _doc = doc
         _errors__ = []
         if 'name' in _doc:
             try:
@@ -2215,140 +1776,23 @@ Define an enumerated type.
             else:
                 raise ValidationException("Missing name")
         baseuri = name
-        if 'inVocab' in _doc:
-            try:
-                inVocab = load_field(_doc.get(
-                    'inVocab'), union_of_None_type_or_booltype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `inVocab` field is not valid because:",
-                        SourceLine(_doc, 'inVocab', str),
-                        [e]
-                    )
-                )
-        else:
-            inVocab = None
-        try:
-            symbols = load_field(_doc.get(
-                'symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `symbols` field is not valid because:",
-                    SourceLine(_doc, 'symbols', str),
-                    [e]
-                )
-            )
-        try:
-            type = load_field(_doc.get(
-                'type'), typedsl_enum_d961d79c225752b9fadb617367615ab176b47d77Loader_2, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `type` field is not valid because:",
-                    SourceLine(_doc, 'type', str),
-                    [e]
-                )
-            )
-        if 'doc' in _doc:
-            try:
-                doc = load_field(_doc.get(
-                    'doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `doc` field is not valid because:",
-                        SourceLine(_doc, 'doc', str),
-                        [e]
-                    )
-                )
-        else:
-            doc = None
-        if 'docParent' in _doc:
-            try:
-                docParent = load_field(_doc.get(
-                    'docParent'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `docParent` field is not valid because:",
-                        SourceLine(_doc, 'docParent', str),
-                        [e]
-                    )
-                )
-        else:
-            docParent = None
-        if 'docChild' in _doc:
-            try:
-                docChild = load_field(_doc.get(
-                    'docChild'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_None, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `docChild` field is not valid because:",
-                        SourceLine(_doc, 'docChild', str),
-                        [e]
-                    )
-                )
-        else:
-            docChild = None
-        if 'docAfter' in _doc:
-            try:
-                docAfter = load_field(_doc.get(
-                    'docAfter'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `docAfter` field is not valid because:",
-                        SourceLine(_doc, 'docAfter', str),
-                        [e]
-                    )
-                )
-        else:
-            docAfter = None
-        if 'jsonldPredicate' in _doc:
-            try:
-                jsonldPredicate = load_field(_doc.get(
-                    'jsonldPredicate'), union_of_None_type_or_strtype_or_JsonldPredicateLoader, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `jsonldPredicate` field is not valid because:",
-                        SourceLine(_doc, 'jsonldPredicate', str),
-                        [e]
-                    )
-                )
-        else:
-            jsonldPredicate = None
-        if 'documentRoot' in _doc:
-            try:
-                documentRoot = load_field(_doc.get(
-                    'documentRoot'), union_of_None_type_or_booltype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `documentRoot` field is not valid because:",
-                        SourceLine(_doc, 'documentRoot', str),
-                        [e]
-                    )
-                )
-        else:
-            documentRoot = None
-        if 'extends' in _doc:
+
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
             try:
-                extends = load_field(_doc.get(
-                    'extends'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_1, baseuri, loadingOptions)
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
             except ValidationException as e:
                 _errors__.append(
                     ValidationException(
-                        "the `extends` field is not valid because:",
-                        SourceLine(_doc, 'extends', str),
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
                         [e]
                     )
                 )
-        else:
-            extends = None
 
         extension_fields = CommentedMap()
         for k in _doc.keys():
@@ -2371,7 +1815,7 @@ Define an enumerated type.
 
         if _errors__:
             raise ValidationException("Trying 'SaladEnumSchema'", None, _errors__)
-        return cls(name=name, inVocab=inVocab, symbols=symbols, type=type, doc=doc, docParent=docParent, docChild=docChild, docAfter=docAfter, jsonldPredicate=jsonldPredicate, documentRoot=documentRoot, extends=extends, extension_fields=extension_fields, loadingOptions=loadingOptions)
+        return cls(name=name, extension_fields=extension_fields, loadingOptions=loadingOptions, **_loaded)
 
     def save(self, top=False, base_url="", relative_uris=True):
         # type: (bool, str, bool) -> Dict[str, Any]
@@ -2379,100 +1823,27 @@ Define an enumerated type.
         for ef in self.extension_fields:
             r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
 
-        if self.name is not None:
-            u = save_relative_uri(
-                self.name,
-                base_url,
-                True,
-                None,
-                relative_uris)
-            if u:
-                r['name'] = u
-
-        if self.inVocab is not None:
-            r['inVocab'] = save(
-                self.inVocab,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.symbols is not None:
-            u = save_relative_uri(
-                self.symbols,
-                self.name,
-                True,
-                None,
-                relative_uris)
-            if u:
-                r['symbols'] = u
-
-        if self.type is not None:
-            r['type'] = save(
-                self.type,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.doc is not None:
-            r['doc'] = save(
-                self.doc,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.docParent is not None:
-            u = save_relative_uri(
-                self.docParent,
-                self.name,
-                False,
-                None,
-                relative_uris)
-            if u:
-                r['docParent'] = u
-
-        if self.docChild is not None:
-            u = save_relative_uri(
-                self.docChild,
-                self.name,
-                False,
-                None,
-                relative_uris)
-            if u:
-                r['docChild'] = u
-
-        if self.docAfter is not None:
-            u = save_relative_uri(
-                self.docAfter,
-                self.name,
-                False,
-                None,
-                relative_uris)
-            if u:
-                r['docAfter'] = u
-
-        if self.jsonldPredicate is not None:
-            r['jsonldPredicate'] = save(
-                self.jsonldPredicate,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.documentRoot is not None:
-            r['documentRoot'] = save(
-                self.documentRoot,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.extends is not None:
-            u = save_relative_uri(
-                self.extends,
-                self.name,
-                False,
-                1,
-                relative_uris)
-            if u:
-                r['extends'] = u
+        _id_base = self.name
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
 
         # top refers to the directory level
         if top:
@@ -2482,7 +1853,20 @@ Define an enumerated type.
                 r["$schemas"] = self.loadingOptions.schemas
         return r
 
-    attrs = frozenset(['name', 'inVocab', 'symbols', 'type', 'doc', 'docParent', 'docChild', 'docAfter', 'jsonldPredicate', 'documentRoot', 'extends'])
+    attrs = frozenset(('name', 'inVocab', 'symbols', 'type', 'doc', 'docParent', 'docChild', 'docAfter', 'jsonldPredicate', 'documentRoot', 'extends'))
+    _save_specs = (
+        ('name', 'name', False, (True, None)),
+        ('inVocab', 'inVocab', True, None),
+        ('symbols', 'symbols', True, (True, None)),
+        ('type', 'type', True, None),
+        ('doc', 'doc', True, None),
+        ('docParent', 'docParent', True, (False, None)),
+        ('docChild', 'docChild', True, (False, None)),
+        ('docAfter', 'docAfter', True, (False, None)),
+        ('jsonldPredicate', 'jsonldPredicate', True, None),
+        ('documentRoot', 'documentRoot', True, None),
+        ('extends', 'extends', True, (False, 1)),
+    )  # type: Tuple[_SaveSpec, ...]
 
 
 class Documentation(NamedType, DocType):
@@ -2491,6 +1875,8 @@ A documentation section.  This type exists to facilitate self-documenting
 schemas but has no role in formal validation.
 
     """
+    __slots__ = ('name', 'inVocab', 'doc', 'docParent', 'docChild', 'docAfter', 'type', 'extension_fields', 'loadingOptions')
+
     def __init__(
         self,
         name,  # type: Any
@@ -2504,14 +1890,8 @@ schemas but has no role in formal validation.
         loadingOptions=None  # type: Optional[LoadingOptions]
     ):  # type: (...) -> None
 
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
         self.name = name
         self.inVocab = inVocab
         self.doc = doc
@@ -2524,10 +1904,7 @@ schemas but has no role in formal validation.
     def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> Documentation
 
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
+        _doc = doc
         _errors__ = []
         if 'name' in _doc:
             try:
@@ -2550,87 +1927,23 @@ schemas but has no role in formal validation.
             else:
                 raise ValidationException("Missing name")
         baseuri = name
-        if 'inVocab' in _doc:
-            try:
-                inVocab = load_field(_doc.get(
-                    'inVocab'), union_of_None_type_or_booltype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `inVocab` field is not valid because:",
-                        SourceLine(_doc, 'inVocab', str),
-                        [e]
-                    )
-                )
-        else:
-            inVocab = None
-        if 'doc' in _doc:
-            try:
-                doc = load_field(_doc.get(
-                    'doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `doc` field is not valid because:",
-                        SourceLine(_doc, 'doc', str),
-                        [e]
-                    )
-                )
-        else:
-            doc = None
-        if 'docParent' in _doc:
-            try:
-                docParent = load_field(_doc.get(
-                    'docParent'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `docParent` field is not valid because:",
-                        SourceLine(_doc, 'docParent', str),
-                        [e]
-                    )
-                )
-        else:
-            docParent = None
-        if 'docChild' in _doc:
-            try:
-                docChild = load_field(_doc.get(
-                    'docChild'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_None, baseuri, loadingOptions)
-            except ValidationException as e:
-                _errors__.append(
-                    ValidationException(
-                        "the `docChild` field is not valid because:",
-                        SourceLine(_doc, 'docChild', str),
-                        [e]
-                    )
-                )
-        else:
-            docChild = None
-        if 'docAfter' in _doc:
+
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
             try:
-                docAfter = load_field(_doc.get(
-                    'docAfter'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
             except ValidationException as e:
                 _errors__.append(
                     ValidationException(
-                        "the `docAfter` field is not valid because:",
-                        SourceLine(_doc, 'docAfter', str),
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
                         [e]
                     )
                 )
-        else:
-            docAfter = None
-        try:
-            type = load_field(_doc.get(
-                'type'), typedsl_enum_056429f0e9355680bd9b2411dc96a69c7ff2e76bLoader_2, baseuri, loadingOptions)
-        except ValidationException as e:
-            _errors__.append(
-                ValidationException(
-                    "the `type` field is not valid because:",
-                    SourceLine(_doc, 'type', str),
-                    [e]
-                )
-            )
 
         extension_fields = CommentedMap()
         for k in _doc.keys():
@@ -2653,7 +1966,7 @@ schemas but has no role in formal validation.
 
         if _errors__:
             raise ValidationException("Trying 'Documentation'", None, _errors__)
-        return cls(name=name, inVocab=inVocab, doc=doc, docParent=docParent, docChild=docChild, docAfter=docAfter, type=type, extension_fields=extension_fields, loadingOptions=loadingOptions)
+        return cls(name=name, extension_fields=extension_fields, loadingOptions=loadingOptions, **_loaded)
 
     def save(self, top=False, base_url="", relative_uris=True):
         # type: (bool, str, bool) -> Dict[str, Any]
@@ -2661,66 +1974,27 @@ schemas but has no role in formal validation.
         for ef in self.extension_fields:
             r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
 
-        if self.name is not None:
-            u = save_relative_uri(
-                self.name,
-                base_url,
-                True,
-                None,
-                relative_uris)
-            if u:
-                r['name'] = u
-
-        if self.inVocab is not None:
-            r['inVocab'] = save(
-                self.inVocab,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.doc is not None:
-            r['doc'] = save(
-                self.doc,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
-
-        if self.docParent is not None:
-            u = save_relative_uri(
-                self.docParent,
-                self.name,
-                False,
-                None,
-                relative_uris)
-            if u:
-                r['docParent'] = u
-
-        if self.docChild is not None:
-            u = save_relative_uri(
-                self.docChild,
-                self.name,
-                False,
-                None,
-                relative_uris)
-            if u:
-                r['docChild'] = u
-
-        if self.docAfter is not None:
-            u = save_relative_uri(
-                self.docAfter,
-                self.name,
-                False,
-                None,
-                relative_uris)
-            if u:
-                r['docAfter'] = u
-
-        if self.type is not None:
-            r['type'] = save(
-                self.type,
-                top=False,
-                base_url=self.name,
-                relative_uris=relative_uris)
+        _id_base = self.name
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
 
         # top refers to the directory level
         if top:
@@ -2730,10 +2004,19 @@ schemas but has no role in formal validation.
                 r["$schemas"] = self.loadingOptions.schemas
         return r
 
-    attrs = frozenset(['name', 'inVocab', 'doc', 'docParent', 'docChild', 'docAfter', 'type'])
+    attrs = frozenset(('name', 'inVocab', 'doc', 'docParent', 'docChild', 'docAfter', 'type'))
+    _save_specs = (
+        ('name', 'name', False, (True, None)),
+        ('inVocab', 'inVocab', True, None),
+        ('doc', 'doc', True, None),
+        ('docParent', 'docParent', True, (False, None)),
+        ('docChild', 'docChild', True, (False, None)),
+        ('docAfter', 'docAfter', True, (False, None)),
+        ('type', 'type', True, None),
+    )  # type: Tuple[_SaveSpec, ...]
 
 
-_vocab = {
+_vocab = MappingProxyType({
     "Any": "https://w3id.org/cwl/salad#Any",
     "ArraySchema": "https://w3id.org/cwl/salad#ArraySchema",
     "DocType": "https://w3id.org/cwl/salad#DocType",
@@ -2761,8 +2044,8 @@ _vocab = {
     "null": "https://w3id.org/cwl/salad#null",
     "record": "https://w3id.org/cwl/salad#record",
     "string": "http://www.w3.org/2001/XMLSchema#string",
-}
-_rvocab = {
+})
+_rvocab = MappingProxyType({
     "https://w3id.org/cwl/salad#Any": "Any",
     "https://w3id.org/cwl/salad#ArraySchema": "ArraySchema",
     "https://w3id.org/cwl/salad#DocType": "DocType",
@@ -2790,7 +2073,7 @@ _rvocab = {
     "https://w3id.org/cwl/salad#null": "null",
     "https://w3id.org/cwl/salad#record": "record",
     "http://www.w3.org/2001/XMLSchema#string": "string",
-}
+})
 
 strtype = _PrimitiveLoader((str, str))
 inttype = _PrimitiveLoader(int)
@@ -2817,10 +2100,10 @@ DocumentationLoader = _RecordLoader(Documentation)
 array_of_strtype = _ArrayLoader(strtype)
 union_of_None_type_or_strtype_or_array_of_strtype = _UnionLoader((None_type, strtype, array_of_strtype,))
 uri_strtype_True_False_None = _URILoader(strtype, True, False, None)
-union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype = _UnionLoader((PrimitiveTypeLoader, RecordSchemaLoader, EnumSchemaLoader, ArraySchemaLoader, strtype,))
-array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype = _ArrayLoader(union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype)
-union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype = _UnionLoader((PrimitiveTypeLoader, RecordSchemaLoader, EnumSchemaLoader, ArraySchemaLoader, strtype, array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype,))
-typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2 = _TypeDSLLoader(union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype, 2)
+union_of_51e86ef3349aa3a1 = _UnionLoader((PrimitiveTypeLoader, RecordSchemaLoader, EnumSchemaLoader, ArraySchemaLoader, strtype,))
+array_of_union_of_51e86ef3349aa3a1 = _ArrayLoader(union_of_51e86ef3349aa3a1)
+union_of_bd4181d02b0e4183 = _UnionLoader((PrimitiveTypeLoader, RecordSchemaLoader, EnumSchemaLoader, ArraySchemaLoader, strtype, array_of_union_of_51e86ef3349aa3a1,))
+typedsl_union_of_bd4181d02b0e4183_2 = _TypeDSLLoader(union_of_bd4181d02b0e4183, 2)
 array_of_RecordFieldLoader = _ArrayLoader(RecordFieldLoader)
 union_of_None_type_or_array_of_RecordFieldLoader = _UnionLoader((None_type, array_of_RecordFieldLoader,))
 idmap_fields_union_of_None_type_or_array_of_RecordFieldLoader = _IdMapLoader(union_of_None_type_or_array_of_RecordFieldLoader, 'name', 'type')
@@ -2829,7 +2112,7 @@ typedsl_enum_d9cba076fca539106791a4f46d198c7fcfbdb779Loader_2 = _TypeDSLLoader(e
 uri_array_of_strtype_True_False_None = _URILoader(array_of_strtype, True, False, None)
 enum_d961d79c225752b9fadb617367615ab176b47d77Loader = _EnumLoader(("enum",))
 typedsl_enum_d961d79c225752b9fadb617367615ab176b47d77Loader_2 = _TypeDSLLoader(enum_d961d79c225752b9fadb617367615ab176b47d77Loader, 2)
-uri_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_False_True_2 = _URILoader(union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype, False, True, 2)
+uri_union_of_bd4181d02b0e4183_False_True_2 = _URILoader(union_of_bd4181d02b0e4183, False, True, 2)
 enum_d062602be0b4b8fd33e69e29a841317b6ab665bcLoader = _EnumLoader(("array",))
 typedsl_enum_d062602be0b4b8fd33e69e29a841317b6ab665bcLoader_2 = _TypeDSLLoader(enum_d062602be0b4b8fd33e69e29a841317b6ab665bcLoader, 2)
 union_of_None_type_or_strtype = _UnionLoader((None_type, strtype,))
@@ -2838,22 +2121,95 @@ union_of_None_type_or_booltype = _UnionLoader((None_type, booltype,))
 union_of_None_type_or_inttype = _UnionLoader((None_type, inttype,))
 uri_strtype_False_False_1 = _URILoader(strtype, False, False, 1)
 uri_union_of_None_type_or_strtype_False_False_None = _URILoader(union_of_None_type_or_strtype, False, False, None)
-uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_None = _URILoader(union_of_None_type_or_strtype_or_array_of_strtype, False, False, None)
+uri_9429bed4a731323c = _URILoader(union_of_None_type_or_strtype_or_array_of_strtype, False, False, None)
 union_of_None_type_or_strtype_or_JsonldPredicateLoader = _UnionLoader((None_type, strtype, JsonldPredicateLoader,))
 union_of_None_type_or_Any_type = _UnionLoader((None_type, Any_type,))
 array_of_SaladRecordFieldLoader = _ArrayLoader(SaladRecordFieldLoader)
 union_of_None_type_or_array_of_SaladRecordFieldLoader = _UnionLoader((None_type, array_of_SaladRecordFieldLoader,))
-idmap_fields_union_of_None_type_or_array_of_SaladRecordFieldLoader = _IdMapLoader(union_of_None_type_or_array_of_SaladRecordFieldLoader, 'name', 'type')
-uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_1 = _URILoader(union_of_None_type_or_strtype_or_array_of_strtype, False, False, 1)
+idmap_82dbf6298189e9be = _IdMapLoader(union_of_None_type_or_array_of_SaladRecordFieldLoader, 'name', 'type')
+uri_639259a5808038ef = _URILoader(union_of_None_type_or_strtype_or_array_of_strtype, False, False, 1)
 array_of_SpecializeDefLoader = _ArrayLoader(SpecializeDefLoader)
 union_of_None_type_or_array_of_SpecializeDefLoader = _UnionLoader((None_type, array_of_SpecializeDefLoader,))
-idmap_specialize_union_of_None_type_or_array_of_SpecializeDefLoader = _IdMapLoader(union_of_None_type_or_array_of_SpecializeDefLoader, 'specializeFrom', 'specializeTo')
+idmap_db0ec34bcd42b3f3 = _IdMapLoader(union_of_None_type_or_array_of_SpecializeDefLoader, 'specializeFrom', 'specializeTo')
 enum_056429f0e9355680bd9b2411dc96a69c7ff2e76bLoader = _EnumLoader(("documentation",))
 typedsl_enum_056429f0e9355680bd9b2411dc96a69c7ff2e76bLoader_2 = _TypeDSLLoader(enum_056429f0e9355680bd9b2411dc96a69c7ff2e76bLoader, 2)
-union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader = _UnionLoader((SaladRecordSchemaLoader, SaladEnumSchemaLoader, DocumentationLoader,))
-array_of_union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader = _ArrayLoader(union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader)
-union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader_or_array_of_union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader = _UnionLoader((SaladRecordSchemaLoader, SaladEnumSchemaLoader, DocumentationLoader, array_of_union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader,))
+union_of_37027b9ff6736996 = _UnionLoader((SaladRecordSchemaLoader, SaladEnumSchemaLoader, DocumentationLoader,))
+array_of_union_of_37027b9ff6736996 = _ArrayLoader(union_of_37027b9ff6736996)
+union_of_b01d20ae8a00869e = _UnionLoader((SaladRecordSchemaLoader, SaladEnumSchemaLoader, DocumentationLoader, array_of_union_of_37027b9ff6736996,))
 
+RecordField._field_loaders = (
+    ('doc', union_of_None_type_or_strtype_or_array_of_strtype, True, 'doc'),
+    ('type', typedsl_union_of_bd4181d02b0e4183_2, False, 'type'),
+)
+RecordSchema._field_loaders = (
+    ('fields', idmap_fields_union_of_None_type_or_array_of_RecordFieldLoader, True, 'fields'),
+    ('type', typedsl_enum_d9cba076fca539106791a4f46d198c7fcfbdb779Loader_2, False, 'type'),
+)
+EnumSchema._field_loaders = (
+    ('symbols', uri_array_of_strtype_True_False_None, False, 'symbols'),
+    ('type', typedsl_enum_d961d79c225752b9fadb617367615ab176b47d77Loader_2, False, 'type'),
+)
+ArraySchema._field_loaders = (
+    ('items', uri_union_of_bd4181d02b0e4183_False_True_2, False, 'items'),
+    ('type', typedsl_enum_d062602be0b4b8fd33e69e29a841317b6ab665bcLoader_2, False, 'type'),
+)
+JsonldPredicate._field_loaders = (
+    ('_id', uri_union_of_None_type_or_strtype_True_False_None, True, '_id'),
+    ('_type', union_of_None_type_or_strtype, True, '_type'),
+    ('_container', union_of_None_type_or_strtype, True, '_container'),
+    ('identity', union_of_None_type_or_booltype, True, 'identity'),
+    ('noLinkCheck', union_of_None_type_or_booltype, True, 'noLinkCheck'),
+    ('mapSubject', union_of_None_type_or_strtype, True, 'mapSubject'),
+    ('mapPredicate', union_of_None_type_or_strtype, True, 'mapPredicate'),
+    ('refScope', union_of_None_type_or_inttype, True, 'refScope'),
+    ('typeDSL', union_of_None_type_or_booltype, True, 'typeDSL'),
+    ('secondaryFilesDSL', union_of_None_type_or_booltype, True, 'secondaryFilesDSL'),
+    ('subscope', union_of_None_type_or_strtype, True, 'subscope'),
+)
+SpecializeDef._field_loaders = (
+    ('specializeFrom', uri_strtype_False_False_1, False, 'specializeFrom'),
+    ('specializeTo', uri_strtype_False_False_1, False, 'specializeTo'),
+)
+SaladRecordField._field_loaders = (
+    ('doc', union_of_None_type_or_strtype_or_array_of_strtype, True, 'doc'),
+    ('type', typedsl_union_of_bd4181d02b0e4183_2, False, 'type'),
+    ('jsonldPredicate', union_of_None_type_or_strtype_or_JsonldPredicateLoader, True, 'jsonldPredicate'),
+    ('default', union_of_None_type_or_Any_type, True, 'default'),
+)
+SaladRecordSchema._field_loaders = (
+    ('inVocab', union_of_None_type_or_booltype, True, 'inVocab'),
+    ('fields', idmap_82dbf6298189e9be, True, 'fields'),
+    ('type', typedsl_enum_d9cba076fca539106791a4f46d198c7fcfbdb779Loader_2, False, 'type'),
+    ('doc', union_of_None_type_or_strtype_or_array_of_strtype, True, 'doc'),
+    ('docParent', uri_union_of_None_type_or_strtype_False_False_None, True, 'docParent'),
+    ('docChild', uri_9429bed4a731323c, True, 'docChild'),
+    ('docAfter', uri_union_of_None_type_or_strtype_False_False_None, True, 'docAfter'),
+    ('jsonldPredicate', union_of_None_type_or_strtype_or_JsonldPredicateLoader, True, 'jsonldPredicate'),
+    ('documentRoot', union_of_None_type_or_booltype, True, 'documentRoot'),
+    ('abstract', union_of_None_type_or_booltype, True, 'abstract'),
+    ('extends', uri_639259a5808038ef, True, 'extends'),
+    ('specialize', idmap_db0ec34bcd42b3f3, True, 'specialize'),
+)
+SaladEnumSchema._field_loaders = (
+    ('inVocab', union_of_None_type_or_booltype, True, 'inVocab'),
+    ('symbols', uri_array_of_strtype_True_False_None, False, 'symbols'),
+    ('type', typedsl_enum_d961d79c225752b9fadb617367615ab176b47d77Loader_2, False, 'type'),
+    ('doc', union_of_None_type_or_strtype_or_array_of_strtype, True, 'doc'),
+    ('docParent', uri_union_of_None_type_or_strtype_False_False_None, True, 'docParent'),
+    ('docChild', uri_9429bed4a731323c, True, 'docChild'),
+    ('docAfter', uri_union_of_None_type_or_strtype_False_False_None, True, 'docAfter'),
+    ('jsonldPredicate', union_of_None_type_or_strtype_or_JsonldPredicateLoader, True, 'jsonldPredicate'),
+    ('documentRoot', union_of_None_type_or_booltype, True, 'documentRoot'),
+    ('extends', uri_639259a5808038ef, True, 'extends'),
+)
+Documentation._field_loaders = (
+    ('inVocab', union_of_None_type_or_booltype, True, 'inVocab'),
+    ('doc', union_of_None_type_or_strtype_or_array_of_strtype, True, 'doc'),
+    ('docParent', uri_union_of_None_type_or_strtype_False_False_None, True, 'docParent'),
+    ('docChild', uri_9429bed4a731323c, True, 'docChild'),
+    ('docAfter', uri_union_of_None_type_or_strtype_False_False_None, True, 'docAfter'),
+    ('type', typedsl_enum_056429f0e9355680bd9b2411dc96a69c7ff2e76bLoader_2, False, 'type'),
+)
 
 def load_document(doc, baseuri=None, loadingOptions=None):
     # type: (Any, Optional[str], Optional[LoadingOptions]) -> Any
@@ -2861,7 +2217,7 @@ def load_document(doc, baseuri=None, loadingOptions=None):
         baseuri = file_uri(os.getcwd()) + "/"
     if loadingOptions is None:
         loadingOptions = LoadingOptions()
-    return _document_load(union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader_or_array_of_union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader, doc, baseuri, loadingOptions)
+    return _document_load(union_of_b01d20ae8a00869e, doc, baseuri, loadingOptions)
 
 
 def load_document_by_string(string, uri, loadingOptions=None):
@@ -2875,7 +2231,7 @@ def load_document_by_string(string, uri, loadingOptions=None):
         loadingOptions = LoadingOptions(fileuri=uri)
     loadingOptions.idx[uri] = result
 
-    return _document_load(union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader_or_array_of_union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader, result, uri, loadingOptions)
+    return _document_load(union_of_b01d20ae8a00869e, result, uri, loadingOptions)
 
 
 def load_document_by_yaml(yaml, uri, loadingOptions=None):
@@ -2889,4 +2245,4 @@ def load_document_by_yaml(yaml, uri, loadingOptions=None):
         loadingOptions = LoadingOptions(fileuri=uri)
     loadingOptions.idx[uri] = yaml
 
-    return _document_load(union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader_or_array_of_union_of_SaladRecordSchemaLoader_or_SaladEnumSchemaLoader_or_DocumentationLoader, yaml, uri, loadingOptions)
+    return _document_load(union_of_b01d20ae8a00869e, yaml, uri, loadingOptions)
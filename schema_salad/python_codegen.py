@@ -1,5 +1,6 @@
 """Python code generator for a given schema salad definition."""
-from io import StringIO
+import functools
+import hashlib
 from typing import (
     IO,
     Any,
@@ -12,12 +13,13 @@ from typing import (
     Union,
 )
 
-from pkg_resources import resource_stream
+from pkg_resources import resource_string
 
 from . import schema
 from .codegen_base import CodeGenBase, TypeDef
 from .exceptions import SchemaException
 from .schema import shortname
+from .utils import aslist
 
 prims = {
     "http://www.w3.org/2001/XMLSchema#string": TypeDef(
@@ -43,6 +45,188 @@ prims = {
 }
 
 
+_init_body = """
+        self.extension_fields = extension_fields or CommentedMap()
+        self.loadingOptions = loadingOptions or LoadingOptions()
+"""
+
+_from_doc_head = """
+    @classmethod
+    def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
+        # type: (Any, str, LoadingOptions, Optional[str]) -> {classname}
+
+        _doc = doc
+        _errors__ = []
+"""
+
+_save_head = """
+    def save(self, top=False, base_url="", relative_uris=True):
+        # type: (bool, str, bool) -> Dict[str, Any]
+        r = CommentedMap()  # type: Dict[str, Any]
+        for ef in self.extension_fields:
+            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+"""
+
+_class_check = """
+        if _doc.get('class') != '{class_}':
+            raise ValidationException("Not a {class_}")
+
+"""
+
+_class_save = """
+        r['class'] = '{class_}'
+"""
+
+_extension_fields = """
+        extension_fields = CommentedMap()
+        for k in _doc.keys():
+            if k not in cls.attrs:
+                if ":" in k:
+                    ex = expand_url(k,
+                                    "",
+                                    loadingOptions,
+                                    scoped_id=False,
+                                    vocab_term=False)
+                    extension_fields[ex] = _doc[k]
+                else:
+                    _errors__.append(
+                        ValidationException(
+                            "invalid field `{{}}`, expected one of: {attrstr}".format(k),
+                            SourceLine(_doc, k, str)
+                        )
+                    )
+                    break
+
+        if _errors__:
+            raise ValidationException(\"Trying '{class_}'\", None, _errors__)
+"""
+
+_save_top = """
+        # top refers to the directory level
+        if top:
+            if self.loadingOptions.namespaces:
+                r["$namespaces"] = self.loadingOptions.namespaces
+            if self.loadingOptions.schemas:
+                r["$schemas"] = self.loadingOptions.schemas
+"""
+
+_field_load = """        if '{fieldname}' in _doc:
+            try:
+                {safename} = load_field(_doc.get(
+                    '{fieldname}'), {fieldtype}, baseuri, loadingOptions)
+            except ValidationException as e:
+                _errors__.append(
+                    ValidationException(
+                        \"the `{fieldname}` field is not valid because:\",
+                        SourceLine(_doc, '{fieldname}', str),
+                        [e]
+                    )
+                )
+        else:
+            {safename} = None
+"""
+
+_field_loop = """
+        _loaded = {}  # type: Dict[str, Any]
+        for _name, _loader, _optional, _safename in cls._field_loaders:
+            if _optional and _name not in _doc:
+                _loaded[_safename] = None
+                continue
+            try:
+                _loaded[_safename] = load_field(
+                    _doc.get(_name), _loader, baseuri, loadingOptions)
+            except ValidationException as e:
+                _errors__.append(
+                    ValidationException(
+                        "the `{}` field is not valid because:".format(_name),
+                        SourceLine(_doc, _name, str),
+                        [e]
+                    )
+                )
+"""
+
+_id_field_default = """
+        if {safename} is None:
+            if docRoot is not None:
+                {safename} = docRoot
+            else:
+                {opt}
+        baseuri = {safename}
+"""
+
+_save_fields = """
+        _id_base = {id_base}
+        for _attr, _key, _relative_to_id, _uri in self._save_specs:
+            _value = getattr(self, _attr)
+            if _value is None:
+                continue
+            _base = _id_base if _relative_to_id else base_url
+            if _uri is None:
+                r[_key] = save(
+                    _value,
+                    top=False,
+                    base_url=_base,
+                    relative_uris=relative_uris)
+            else:
+                u = save_relative_uri(
+                    _value,
+                    _base,
+                    _uri[0],
+                    _uri[1],
+                    relative_uris)
+                if u:
+                    r[_key] = u
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _support_code() -> str:
+    """Read the runtime support code that prefixes every generated module."""
+    return resource_string(__name__, "python_codegen_support.py").decode("UTF-8")
+
+
+def _loader_name(prefix: str, signature: str) -> str:
+    """
+    Name a loader after its signature, hashing signatures that are too long.
+
+    Nested unions and URI loaders otherwise get identifiers that are hundreds
+    of characters long, and those are repeated at every reference.
+    """
+    if len(prefix) + len(signature) <= 64:
+        return prefix + signature
+    return (
+        prefix + hashlib.blake2b(signature.encode("utf-8"), digest_size=8).hexdigest()
+    )
+
+
+def _type_key(type_declaration: Any) -> Any:
+    """
+    Compute a hashable key identifying a union or array type declaration.
+
+    Named records are identified by their name. Enums give None, as loading
+    them also (re)registers their symbols in the vocabulary.
+    """
+    if isinstance(type_declaration, MutableSequence):
+        subkeys = []
+        for sub in type_declaration:
+            subkey = sub if isinstance(sub, str) else _type_key(sub)
+            if subkey is None:
+                return None
+            subkeys.append(subkey)
+        return ("union", tuple(subkeys))
+    if isinstance(type_declaration, MutableMapping):
+        tp = type_declaration.get("type")
+        if tp in ("array", "https://w3id.org/cwl/salad#array"):
+            items = type_declaration.get("items")
+            itemkey = items if isinstance(items, str) else _type_key(items)
+            return None if itemkey is None else ("array", itemkey)
+        if tp in ("record", "https://w3id.org/cwl/salad#record") and isinstance(
+            type_declaration.get("name"), str
+        ):
+            return (tp, type_declaration["name"])
+    return None
+
+
 class PythonCodeGen(CodeGenBase):
     """Generation of Python code for a given Schema Salad definition."""
 
@@ -50,11 +234,18 @@ class PythonCodeGen(CodeGenBase):
         super().__init__()
         self.out = out
         self.current_class_is_abstract = False
-        self.serializer = StringIO()
+        self.serializer = []  # type: List[str]
+        self.save_specs = []  # type: List[str]
         self.idfield = ""
         self.copyright = copyright
+        self.type_loaders = {}  # type: Dict[Any, TypeDef]
+        self.field_loaders = []  # type: List[str]
+        self.field_tables = []  # type: List[str]
+        self.class_slots = {}  # type: Dict[str, Set[str]]
+        self.dict_classes = set()  # type: Set[str]
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def safe_name(name):  # type: (str) -> str
         avn = schema.avro_field_name(name)
         if avn.startswith("anon."):
@@ -84,14 +275,41 @@ class PythonCodeGen(CodeGenBase):
                 )
             )
 
-        stream = resource_stream(__name__, "python_codegen_support.py")
-        self.out.write(stream.read().decode("UTF-8"))
-        stream.close()
+        self.out.write(_support_code())
         self.out.write("\n\n")
 
         for primative in prims.values():
             self.declare_type(primative)
 
+    def plan_classes(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Find the classes that cannot use __slots__.
+
+        Python refuses to combine several bases that each declare slots of
+        their own, so a class with more than one chain of concrete ancestors
+        keeps a __dict__, as do those ancestors and all their subclasses.
+        """
+        concrete = {}  # type: Dict[str, Set[str]]
+        for rec in records:
+            if rec["type"] != "record":
+                continue
+            name = self.safe_name(rec["name"])
+            ancestors = [
+                concrete.get(self.safe_name(e), set())
+                for e in aslist(rec.get("extends", []))
+            ]
+            ancestors = [a for a in ancestors if a]
+            concrete[name] = set()
+            for a in ancestors:
+                concrete[name].update(a)
+            if ancestors:
+                largest = max(ancestors, key=len)
+                if any(not a <= largest for a in ancestors):
+                    self.dict_classes.add(name)
+                    self.dict_classes.update(concrete[name])
+            if not rec.get("abstract", False):
+                concrete[name].add(name)
+
     def begin_class(
         self,  # pylint: disable=too-many-arguments
         classname: str,
@@ -103,121 +321,84 @@ class PythonCodeGen(CodeGenBase):
         optional_fields: Set[str],
     ):  # type: (...) -> None
         classname = self.safe_name(classname)
+        bases = [self.safe_name(e) for e in extends]
 
-        if extends:
-            ext = ", ".join(self.safe_name(e) for e in extends)
+        if bases:
+            ext = ", ".join(bases)
         else:
             ext = "Savable"
 
+        inherited = set()  # type: Set[str]
+        for base in bases:
+            inherited.update(self.class_slots.get(base, ()))
+        if any(base in self.dict_classes for base in bases):
+            self.dict_classes.add(classname)
+
         self.out.write(f"class {classname}({ext}):\n")
 
         if doc:
-            self.out.write('    """\n')
-            self.out.write(str(doc))
-            self.out.write('\n    """\n')
+            self.out.write(f'    """\n{doc}\n    """\n')
 
-        self.serializer = StringIO()
+        self.serializer = []
+        self.save_specs = []
+        self.field_loaders = []
 
         self.current_class_is_abstract = abstract
         if self.current_class_is_abstract:
-            self.out.write("    pass\n\n\n")
+            self.class_slots[classname] = inherited
+            self.out.write("    __slots__ = ()\n\n\n")
             return
 
-        required_field_names = [f for f in field_names if f not in optional_fields]
-        optional_field_names = [f for f in field_names if f in optional_fields]
+        slots = [
+            "class_" if f == "class" else self.safe_name(f) for f in field_names
+        ] + ["extension_fields", "loadingOptions"]
+        own_slots = tuple(f for f in slots if f not in inherited)
+        self.class_slots[classname] = inherited.union(own_slots)
+
+        required_inits = []  # type: List[str]
+        optional_inits = []  # type: List[str]
+        for f in field_names:
+            if f == "class":
+                continue
+            if f in optional_fields:
+                optional_inits.append(f"        {self.safe_name(f)}=None,  # type: Any")
+            else:
+                required_inits.append(f"        {self.safe_name(f)},  # type: Any")
 
-        safe_inits = ["        self,"]  # type: List[str]
-        safe_inits.extend(
-            [
-                "        {},  # type: Any".format(self.safe_name(f))
-                for f in required_field_names
-                if f != "class"
-            ]
-        )
-        safe_inits.extend(
-            [
-                "        {}=None,  # type: Any".format(self.safe_name(f))
-                for f in optional_field_names
-                if f != "class"
-            ]
-        )
+        if classname in self.dict_classes:
+            slots_decl = ""
+        else:
+            slots_decl = f"    __slots__ = {own_slots!r}\n\n"
+
+        safe_inits = ["        self,"] + required_inits + optional_inits
         self.out.write(
-            "    def __init__(\n"
+            slots_decl
+            + "    def __init__(\n"
             + "\n".join(safe_inits)
             + "\n        extension_fields=None,  "
             + "# type: Optional[Dict[str, Any]]"
             + "\n        loadingOptions=None  # type: Optional[LoadingOptions]"
             + "\n    ):  # type: (...) -> None\n"
-            + """
-        if extension_fields:
-            self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
-        if loadingOptions:
-            self.loadingOptions = loadingOptions
-        else:
-            self.loadingOptions = LoadingOptions()
-"""
+            + _init_body
         )
         field_inits = ""
         for name in field_names:
             if name == "class":
-                field_inits += """        self.class_ = "{}"
-""".format(
-                    classname
-                )
+                field_inits += f'        self.class_ = "{classname}"\n'
             else:
-                field_inits += """        self.{0} = {0}
-""".format(
-                    self.safe_name(name)
-                )
+                safename = self.safe_name(name)
+                field_inits += f"        self.{safename} = {safename}\n"
         self.out.write(
-            field_inits
-            + """
-    @classmethod
-    def fromDoc(cls, doc, baseuri, loadingOptions, docRoot=None):
-        # type: (Any, str, LoadingOptions, Optional[str]) -> {}
-
-        _doc = copy.copy(doc)
-        if hasattr(doc, 'lc'):
-            _doc.lc.data = doc.lc.data
-            _doc.lc.filename = doc.lc.filename
-        _errors__ = []
-""".format(
-                classname
-            )
+            field_inits + _from_doc_head.format_map({"classname": classname})
         )
 
         self.idfield = idfield
 
-        self.serializer.write(
-            """
-    def save(self, top=False, base_url="", relative_uris=True):
-        # type: (bool, str, bool) -> Dict[str, Any]
-        r = CommentedMap()  # type: Dict[str, Any]
-        for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
-"""
-        )
+        self.serializer.append(_save_head)
 
         if "class" in field_names:
-            self.out.write(
-                """
-        if _doc.get('class') != '{class_}':
-            raise ValidationException("Not a {class_}")
-
-""".format(
-                    class_=classname
-                )
-            )
-
-            self.serializer.write(
-                """
-        r['class'] = '{class_}'
-""".format(
-                    class_=classname
-                )
-            )
+            self.out.write(_class_check.format_map({"class_": classname}))
+            self.serializer.append(_class_save.format_map({"class_": classname}))
 
     def end_class(self, classname, field_names):
         # type: (str, List[str]) -> None
@@ -225,75 +406,79 @@ class PythonCodeGen(CodeGenBase):
         if self.current_class_is_abstract:
             return
 
-        self.out.write(
-            """
-        extension_fields = CommentedMap()
-        for k in _doc.keys():
-            if k not in cls.attrs:
-                if ":" in k:
-                    ex = expand_url(k,
-                                    "",
-                                    loadingOptions,
-                                    scoped_id=False,
-                                    vocab_term=False)
-                    extension_fields[ex] = _doc[k]
-                else:
-                    _errors__.append(
-                        ValidationException(
-                            "invalid field `{{}}`, expected one of: {attrstr}".format(k),
-                            SourceLine(_doc, k, str)
-                        )
-                    )
-                    break
+        classname = self.safe_name(classname)
+        if self.field_loaders:
+            self.field_tables.append(
+                f"{classname}._field_loaders = (\n"
+                + "".join(self.field_loaders)
+                + ")\n"
+            )
+            self.out.write(_field_loop)
 
-        if _errors__:
-            raise ValidationException(\"Trying '{class_}'\", None, _errors__)
-""".format(
-                attrstr=", ".join([f"`{f}`" for f in field_names]),
-                class_=self.safe_name(classname),
+        self.out.write(
+            _extension_fields.format_map(
+                {
+                    "attrstr": ", ".join([f"`{f}`" for f in field_names]),
+                    "class_": classname,
+                }
             )
         )
 
-        self.serializer.write(
-            """
-        # top refers to the directory level
-        if top:
-            if self.loadingOptions.namespaces:
-                r["$namespaces"] = self.loadingOptions.namespaces
-            if self.loadingOptions.schemas:
-                r["$schemas"] = self.loadingOptions.schemas
-"""
-        )
+        if self.idfield:
+            id_base = f"self.{self.safe_name(self.idfield)}"
+        else:
+            id_base = "base_url"
+        self.serializer.append(_save_fields.format_map({"id_base": id_base}))
 
-        self.serializer.write("        return r\n\n")
+        self.serializer.append(_save_top)
 
-        self.serializer.write(f"    attrs = frozenset({field_names})\n")
+        self.serializer.append("        return r\n\n")
 
-        safe_init_fields = [
-            self.safe_name(f) for f in field_names if f != "class"
-        ]  # type: List[str]
+        self.serializer.append(f"    attrs = frozenset({tuple(field_names)!r})\n")
 
-        safe_inits = [f + "=" + f for f in safe_init_fields]
+        self.serializer.append(
+            "    _save_specs = (\n"
+            + "".join(self.save_specs)
+            + "    )  # type: Tuple[_SaveSpec, ...]\n"
+        )
+
+        safe_inits = []  # type: List[str]
+        if self.idfield:
+            idname = self.safe_name(self.idfield)
+            safe_inits.append(idname + "=" + idname)
 
         safe_inits.extend(
             ["extension_fields=extension_fields", "loadingOptions=loadingOptions"]
         )
+        if self.field_loaders:
+            safe_inits.append("**_loaded")
 
         self.out.write("        return cls(" + ", ".join(safe_inits) + ")\n")
 
-        self.out.write(str(self.serializer.getvalue()))
+        self.out.write("".join(self.serializer))
 
         self.out.write("\n\n")
 
     def type_loader(self, type_declaration):
         # type: (Union[List[Any], Dict[str, Any], str]) -> TypeDef
-
+        key = _type_key(type_declaration)
+        if key is not None:
+            cached = self.type_loaders.get(key)
+            if cached is not None:
+                return cached
+        loader = self.build_type_loader(type_declaration)
+        if key is not None:
+            self.type_loaders[key] = loader
+        return loader
+
+    def build_type_loader(self, type_declaration):
+        # type: (Union[List[Any], Dict[str, Any], str]) -> TypeDef
         if isinstance(type_declaration, MutableSequence):
 
             sub = [self.type_loader(i) for i in type_declaration]
             return self.declare_type(
                 TypeDef(
-                    "union_of_{}".format("_or_".join(s.name for s in sub)),
+                    _loader_name("union_of_", "_or_".join(s.name for s in sub)),
                     "_UnionLoader(({},))".format(", ".join(s.name for s in sub)),
                 )
             )
@@ -358,31 +543,29 @@ class PythonCodeGen(CodeGenBase):
         if self.current_class_is_abstract:
             return
 
-        self.declare_field(name, fieldtype, doc, True)
+        fieldname = shortname(name)
+        safename = self.safe_name(name)
+        self.out.write(
+            _field_load.format_map(
+                {
+                    "safename": safename,
+                    "fieldname": fieldname,
+                    "fieldtype": fieldtype.name,
+                }
+            )
+        )
+        self.field_serializer(name, fieldname, safename, fieldtype)
 
         if optional:
-            opt = """{safename} = "_:" + str(_uuid__.uuid4())""".format(
-                safename=self.safe_name(name)
-            )
+            opt = f"""{self.safe_name(name)} = "_:" + str(_uuid__.uuid4())"""
         else:
-            opt = """raise ValidationException("Missing {fieldname}")""".format(
-                fieldname=shortname(name)
-            )
+            opt = f"""raise ValidationException("Missing {shortname(name)}")"""
 
         if subscope is not None:
             name = name + subscope
 
         self.out.write(
-            """
-        if {safename} is None:
-            if docRoot is not None:
-                {safename} = docRoot
-            else:
-                {opt}
-        baseuri = {safename}
-""".format(
-                safename=self.safe_name(name), opt=opt
-            )
+            _id_field_default.format_map({"safename": self.safe_name(name), "opt": opt})
         )
 
     def declare_field(
@@ -392,90 +575,37 @@ class PythonCodeGen(CodeGenBase):
         if self.current_class_is_abstract:
             return
 
-        if shortname(name) == "class":
+        fieldname = shortname(name)
+        if fieldname == "class":
             return
+        safename = self.safe_name(name)
 
-        if optional:
-            self.out.write(
-                "        if '{fieldname}' in _doc:\n".format(fieldname=shortname(name))
-            )
-            spc = "    "
-        else:
-            spc = ""
-        self.out.write(
-            """{spc}        try:
-{spc}            {safename} = load_field(_doc.get(
-{spc}                '{fieldname}'), {fieldtype}, baseuri, loadingOptions)
-{spc}        except ValidationException as e:
-{spc}            _errors__.append(
-{spc}                ValidationException(
-{spc}                    \"the `{fieldname}` field is not valid because:\",
-{spc}                    SourceLine(_doc, '{fieldname}', str),
-{spc}                    [e]
-{spc}                )
-{spc}            )
-""".format(
-                safename=self.safe_name(name),
-                fieldname=shortname(name),
-                fieldtype=fieldtype.name,
-                spc=spc,
-            )
+        self.field_loaders.append(
+            f"    ('{fieldname}', {fieldtype.name}, {optional}, '{safename}'),\n"
         )
-        if optional:
-            self.out.write(
-                """        else:
-            {safename} = None
-""".format(
-                    safename=self.safe_name(name)
-                )
-            )
-
-        if name == self.idfield or not self.idfield:
-            baseurl = "base_url"
-        else:
-            baseurl = "self.{}".format(self.safe_name(self.idfield))
+        self.field_serializer(name, fieldname, safename, fieldtype)
 
+    def field_serializer(
+        self, name: str, fieldname: str, safename: str, fieldtype: TypeDef
+    ) -> None:
+        """Output the code to save the given field."""
+        relative_to_id = bool(self.idfield) and name != self.idfield
         if fieldtype.is_uri:
-            self.serializer.write(
-                """
-        if self.{safename} is not None:
-            u = save_relative_uri(
-                self.{safename},
-                {baseurl},
-                {scoped_id},
-                {ref_scope},
-                relative_uris)
-            if u:
-                r['{fieldname}'] = u
-""".format(
-                    safename=self.safe_name(name),
-                    fieldname=shortname(name).strip(),
-                    baseurl=baseurl,
-                    scoped_id=fieldtype.scoped_id,
-                    ref_scope=fieldtype.ref_scope,
-                )
-            )
+            uri = f"({fieldtype.scoped_id}, {fieldtype.ref_scope})"
+            fieldname = fieldname.strip()
         else:
-            self.serializer.write(
-                """
-        if self.{safename} is not None:
-            r['{fieldname}'] = save(
-                self.{safename},
-                top=False,
-                base_url={baseurl},
-                relative_uris=relative_uris)
-""".format(
-                    safename=self.safe_name(name),
-                    fieldname=shortname(name),
-                    baseurl=baseurl,
-                )
-            )
+            uri = "None"
+        self.save_specs.append(
+            f"        ('{safename}', '{fieldname}', {relative_to_id}, {uri}),\n"
+        )
 
     def uri_loader(self, inner, scoped_id, vocab_term, ref_scope):
         # type: (TypeDef, bool, bool, Union[int, None]) -> TypeDef
         return self.declare_type(
             TypeDef(
-                f"uri_{inner.name}_{scoped_id}_{vocab_term}_{ref_scope}",
+                _loader_name(
+                    "uri_", f"{inner.name}_{scoped_id}_{vocab_term}_{ref_scope}"
+                ),
                 "_URILoader({}, {}, {}, {})".format(
                     inner.name, scoped_id, vocab_term, ref_scope
                 ),
@@ -489,7 +619,7 @@ class PythonCodeGen(CodeGenBase):
         # type: (str, TypeDef, str, Union[str, None]) -> TypeDef
         return self.declare_type(
             TypeDef(
-                "idmap_{}_{}".format(self.safe_name(field), inner.name),
+                _loader_name("idmap_", f"{self.safe_name(field)}_{inner.name}"),
                 "_IdMapLoader({}, '{}', '{}')".format(
                     inner.name, map_subject, map_predicate
                 ),
@@ -500,7 +630,7 @@ class PythonCodeGen(CodeGenBase):
         # type: (TypeDef, Union[int, None]) -> TypeDef
         return self.declare_type(
             TypeDef(
-                f"typedsl_{self.safe_name(inner.name)}_{ref_scope}",
+                _loader_name("typedsl_", f"{self.safe_name(inner.name)}_{ref_scope}"),
                 f"_TypeDSLLoader({self.safe_name(inner.name)}, {ref_scope})",
             )
         )
@@ -516,19 +646,21 @@ class PythonCodeGen(CodeGenBase):
 
     def epilogue(self, root_loader):
         # type: (TypeDef) -> None
-        self.out.write("_vocab = {\n")
-        for k in sorted(self.vocab.keys()):
-            self.out.write('    "{}": "{}",\n'.format(k, self.vocab[k]))
-        self.out.write("}\n")
-
-        self.out.write("_rvocab = {\n")
-        for k in sorted(self.vocab.keys()):
-            self.out.write('    "{}": "{}",\n'.format(self.vocab[k], k))
-        self.out.write("}\n\n")
+        vocab = sorted(self.vocab.items())
+        self.out.write(
+            "".join(
+                ["_vocab = MappingProxyType({\n"]
+                + [f'    "{k}": "{v}",\n' for k, v in vocab]
+                + ["})\n", "_rvocab = MappingProxyType({\n"]
+                + [f'    "{v}": "{k}",\n' for k, v in vocab]
+                + ["})\n\n"]
+            )
+        )
 
         for _, collected_type in self.collected_types.items():
             self.out.write(f"{collected_type.name} = {collected_type.init}\n")
         self.out.write("\n")
+        self.out.write("".join(self.field_tables))
 
         self.out.write(
             """
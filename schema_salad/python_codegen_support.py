@@ -5,10 +5,12 @@ import re
 import tempfile
 import uuid as _uuid__  # pylint: disable=unused-import # noqa: F401
 from io import StringIO
+from types import MappingProxyType
 from typing import (
     Any,
     Dict,
     List,
+    Mapping,
     MutableMapping,
     MutableSequence,
     Optional,
@@ -27,11 +29,19 @@ from schema_salad.exceptions import SchemaSaladException, ValidationException
 from schema_salad.fetcher import DefaultFetcher, Fetcher
 from schema_salad.sourceline import SourceLine, add_lc_filename
 
-_vocab = {}  # type: Dict[str, str]
-_rvocab = {}  # type: Dict[str, str]
+_vocab = MappingProxyType({})  # type: Mapping[str, str]
+_rvocab = MappingProxyType({})  # type: Mapping[str, str]
+
+
+_SaveSpec = Tuple[str, str, bool, Optional[Tuple[bool, Optional[int]]]]
 
 
 class Savable:
+    __slots__ = ()
+
+    _field_loaders = ()  # type: Tuple[Tuple[str, _Loader, bool, str], ...]
+    _save_specs = ()  # type: Tuple[_SaveSpec, ...]
+
     @classmethod
     def fromDoc(cls, _doc, baseuri, loadingOptions, docRoot=None):
         # type: (Any, str, LoadingOptions, Optional[str]) -> Savable
@@ -82,15 +92,34 @@ class LoadingOptions:
         else:
             self.fetcher = fetcher
 
-        self.vocab = _vocab
-        self.rvocab = _rvocab
+        self.vocab = _vocab  # type: Mapping[str, str]
+        self.rvocab = _rvocab  # type: Mapping[str, str]
 
         if namespaces is not None:
-            self.vocab = self.vocab.copy()
-            self.rvocab = self.rvocab.copy()
+            vocab = dict(self.vocab)
+            rvocab = dict(self.rvocab)
             for k, v in namespaces.items():
-                self.vocab[k] = v
-                self.rvocab[v] = k
+                vocab[k] = v
+                rvocab[v] = k
+            self.vocab = vocab
+            self.rvocab = rvocab
+
+    def __getstate__(self):  # type: () -> Dict[str, Any]
+        # The shared read-only vocabularies cannot be pickled or deep
+        # copied; __setstate__ puts them back.
+        state = self.__dict__.copy()
+        if self.vocab is _vocab:
+            state["vocab"] = None
+        if self.rvocab is _rvocab:
+            state["rvocab"] = None
+        return state
+
+    def __setstate__(self, state):  # type: (Dict[str, Any]) -> None
+        self.__dict__.update(state)
+        if self.vocab is None:
+            self.vocab = _vocab
+        if self.rvocab is None:
+            self.rvocab = _rvocab
 
 
 def load_field(val, fieldtype, baseuri, loadingOptions):
@@ -253,10 +282,41 @@ class _ArrayLoader(_Loader):
         r = []  # type: List[Any]
         errors = []  # type: List[SchemaSaladException]
         for i in range(0, len(doc)):
+            val = doc[i]
             try:
-                lf = load_field(
-                    doc[i], _UnionLoader((self, self.items)), baseuri, loadingOptions
-                )
+                if isinstance(val, MutableSequence) or (
+                    isinstance(val, MutableMapping)
+                    and ("$import" in val or "$include" in val)
+                ):
+                    lf = load_field(
+                        doc[i],
+                        _UnionLoader((self, self.items)),
+                        baseuri,
+                        loadingOptions,
+                    )
+                else:
+                    # Same as the union above, without first failing to load
+                    # the scalar or mapping as a nested list.
+                    try:
+                        lf = self.items.load(val, baseuri, loadingOptions)
+                    except ValidationException as e:
+                        raise ValidationException(
+                            "",
+                            None,
+                            [
+                                ValidationException(
+                                    f"tried {self.__class__.__name__} but",
+                                    None,
+                                    [ValidationException("Expected a list")],
+                                ),
+                                ValidationException(
+                                    f"tried {self.items.__class__.__name__} but",
+                                    None,
+                                    [e],
+                                ),
+                            ],
+                            "-",
+                        )
                 if isinstance(lf, MutableSequence):
                     r.extend(lf)
                 else:
@@ -585,7 +645,7 @@ def file_uri(path, split_frag=False):  # type: (str, bool) -> str
         return f"file://{urlpath}{frag}"
 
 
-def prefix_url(url, namespaces):  # type: (str, Dict[str, str]) -> str
+def prefix_url(url, namespaces):  # type: (str, Mapping[str, str]) -> str
     for k, v in namespaces.items():
         if url.startswith(v):
             return k + ":" + url[len(v) :]
@@ -1,5 +1,7 @@
+import copy
 import json
 import os
+import pickle
 from typing import Any
 
 import pytest
@@ -199,6 +201,29 @@ def test_load_metaschema(metaschema_pre: Any) -> None:
     assert saved == JsonDiffMatcher(metaschema_pre)
 
 
+def test_copy_and_pickle() -> None:
+    doc = {
+        "type": "record",
+        "fields": [{"name": "hello", "doc": "Hello test case", "type": "string"}],
+    }
+    rs = cg_metaschema.RecordSchema.fromDoc(
+        doc, "http://example.com/", cg_metaschema.LoadingOptions()
+    )
+    for clone in (copy.deepcopy(rs), pickle.loads(pickle.dumps(rs))):
+        assert clone.loadingOptions.vocab is cg_metaschema._vocab
+        assert clone.loadingOptions.rvocab is cg_metaschema._rvocab
+        assert clone.save() == rs.save()
+
+
+def test_copy_and_pickle_metaschema(metaschema_pre: Any) -> None:
+    path = get_data("metaschema/metaschema.yml")
+    assert path
+    doc = cg_metaschema.load_document(file_uri(path), "", None)
+    for clone in (copy.deepcopy(doc), pickle.loads(pickle.dumps(doc))):
+        saved = [d.save(relative_uris=False) for d in clone]
+        assert saved == JsonDiffMatcher(metaschema_pre)
+
+
 def test_load_by_yaml_metaschema(metaschema_pre: Any) -> None:
     path = get_data("metaschema/metaschema.yml")
     assert path
@@ -1,14 +1,24 @@
+import importlib.util
 import inspect
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Text, cast
 
+import pytest
+
 import schema_salad.metaschema as cg_metaschema
 from schema_salad import codegen
 from schema_salad.avro.schema import Names
 from schema_salad.schema import load_schema
 
 from .test_java_codegen import cwl_file_uri, metaschema_file_uri
+from .util import get_data
+
+
+@pytest.fixture(autouse=True)
+def codegen_cache_home(tmp_path: Path, monkeypatch: Any) -> None:
+    """Keep the codegen cache out of the real home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
 
 
 def test_cwl_gen(tmp_path: Path) -> None:
@@ -35,7 +45,50 @@ def test_meta_schema_gen_up_to_date(tmp_path: Path) -> None:
         assert f.read() == inspect.getsource(cg_metaschema)
 
 
-def python_codegen(file_uri: str, target: Path) -> None:
+def test_meta_schema_gen_cached(tmp_path: Path) -> None:
+    first = tmp_path / "first.py"
+    python_codegen(metaschema_file_uri, first, use_cache=True)
+    cached = list((tmp_path / ".cache" / "salad" / "codegen").glob("*.py"))
+    assert len(cached) == 1
+    os.utime(cached[0], (0, 0))
+    second = tmp_path / "second.py"
+    python_codegen(metaschema_file_uri, second, use_cache=True)
+    assert second.read_text() == first.read_text() == cached[0].read_text()
+    assert cached[0].stat().st_mtime > 0
+
+
+def test_meta_schema_gen_no_cache(tmp_path: Path) -> None:
+    src_target = tmp_path / "src.py"
+    python_codegen(metaschema_file_uri, src_target)
+    assert src_target.read_text() == inspect.getsource(cg_metaschema)
+    assert not (tmp_path / ".cache" / "salad" / "codegen").exists()
+
+
+def test_meta_schema_slots() -> None:
+    field = cg_metaschema.RecordField("name", "string")
+    schema = cg_metaschema.SaladRecordSchema("name", "record")
+    for obj in (field, schema):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_multiple_concrete_parents(tmp_path: Path) -> None:
+    src_target = tmp_path / "multi_parent.py"
+    python_codegen(
+        Path(get_data("tests/test_schema/multi_parent.yml")).as_uri(), src_target
+    )
+    spec = importlib.util.spec_from_file_location("multi_parent", src_target)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    doc = module.load_document_by_string(
+        "title: a\ncaption: b\nvalue: 3\n", "https://example.com/doc.yml"
+    )
+    assert isinstance(doc, module.Named) and isinstance(doc, module.Labelled)
+    assert (doc.title, doc.caption, doc.value) == ("a", "b", 3)
+    assert not hasattr(module.Tagged("t"), "__dict__")
+
+
+def python_codegen(file_uri: str, target: Path, use_cache: bool = False) -> None:
     document_loader, avsc_names, schema_metadata, metaschema_loader = load_schema(
         file_uri
     )
@@ -50,4 +103,5 @@ def python_codegen(file_uri: str, target: Path) -> None:
         schema_metadata,
         document_loader,
         target=str(target),
+        use_cache=use_cache,
     )